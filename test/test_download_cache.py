@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Test script for the on-disk yfinance download cache
+"""
+
+import sys
+import os
+import tempfile
+from types import SimpleNamespace
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+
+from utility import yfinance_data_loader as loader
+
+class _FakeYahoo:
+    """Stands in for loader._yf_download, the clock and CACHE_DIR while a test runs."""
+
+    def __init__(self, cache_dir, data=None):
+        self.cache_dir = cache_dir
+        self.data = data if data is not None else pd.DataFrame(
+            {'Close': [1.0, 2.0]}, index=pd.date_range('2024-01-02', periods=2, freq='h'))
+        self.calls = []
+        self.now = 3600.0 * 1000
+
+    def download(self, symbols, **kwargs):
+        self.calls.append((symbols, kwargs))
+        return self.data
+
+    def __enter__(self):
+        self._saved = (loader._yf_download, loader.time, loader.CACHE_DIR)
+        loader._yf_download = self.download
+        loader.time = SimpleNamespace(time=lambda: self.now)
+        loader.CACHE_DIR = self.cache_dir
+        return self
+
+    def __exit__(self, *exc):
+        loader._yf_download, loader.time, loader.CACHE_DIR = self._saved
+
+    def files(self):
+        return sorted(os.listdir(self.cache_dir)) if os.path.exists(self.cache_dir) else []
+
+def test_cache_key():
+    """Test that only arguments changing the result are part of the cache key."""
+    print("🧪 Testing cache key...")
+
+    with tempfile.TemporaryDirectory() as storage, _FakeYahoo(os.path.join(storage, "cache")) as yahoo:
+        first = loader.download_cached('EURUSD=X', period='5d', interval='1h', progress=False, threads=True)
+        again = loader.download_cached('EURUSD=X', period='5d', interval='1h', threads=True, progress=True)
+        assert len(yahoo.calls) == 1
+        pd.testing.assert_frame_equal(first, again)
+        print("   ✅ progress ignored and keyword order irrelevant")
+
+        loader.download_cached('EURUSD=X', period='5d', interval='1h', threads=False)
+        loader.download_cached('EURUSD=X', period='1mo', interval='1h', threads=True)
+        loader.download_cached('GBPUSD=X', period='5d', interval='1h', threads=True)
+        assert len(yahoo.calls) == 4
+        assert len(yahoo.files()) == 4
+        print("   ✅ Other arguments, periods and symbols cached separately")
+
+        loader.download_cached('EURUSD=X', period='5d', interval='bogus')
+        loader.download_cached('EURUSD=X', period='5d', interval='bogus')
+        assert len(yahoo.calls) == 6
+        print("   ✅ Unknown intervals bypass the cache")
+
+    print("   ✅ Cache key test completed\n")
+
+def test_bar_rollover():
+    """Test that a new bar fetches again and removes the previous bar's copy."""
+    print("🧪 Testing bar rollover...")
+
+    with tempfile.TemporaryDirectory() as storage, _FakeYahoo(os.path.join(storage, "cache")) as yahoo:
+        loader.download_cached('^DJI', period='7d', interval='30m')
+        old_files = yahoo.files()
+
+        yahoo.now += 1799
+        loader.download_cached('^DJI', period='7d', interval='30m')
+        assert len(yahoo.calls) == 1
+        print("   ✅ Served from the cache within the bar")
+
+        yahoo.now += 1
+        loader.download_cached('^DJI', period='7d', interval='30m')
+        assert len(yahoo.calls) == 2
+        assert len(yahoo.files()) == 1 and yahoo.files() != old_files
+        print("   ✅ Refetched in the next bar and old bucket removed")
+
+    print("   ✅ Bar rollover test completed\n")
+
+def test_empty_and_corrupt_files():
+    """Test that empty results are not cached and unreadable files are refetched."""
+    print("🧪 Testing empty results and corrupt cache files...")
+
+    with tempfile.TemporaryDirectory() as storage, _FakeYahoo(os.path.join(storage, "cache")) as yahoo:
+        data = yahoo.data
+        yahoo.data = pd.DataFrame()
+        assert loader.download_cached('^DJI', interval='1h').empty
+        assert yahoo.files() == []
+        print("   ✅ Empty result not cached")
+
+        yahoo.data = data
+        loader.download_cached('^DJI', interval='1h')
+        path = os.path.join(yahoo.cache_dir, yahoo.files()[0])
+        with open(path, 'wb') as f:
+            f.write(b'not a pickle')
+
+        result = loader.download_cached('^DJI', interval='1h')
+        assert len(yahoo.calls) == 3
+        pd.testing.assert_frame_equal(result, data)
+        pd.testing.assert_frame_equal(pd.read_pickle(path), data)
+        print("   ✅ Corrupt cache file replaced by a fresh download")
+
+    print("   ✅ Empty and corrupt file test completed\n")
+
+def main():
+    """Run all download cache tests."""
+    print("🚀 DOWNLOAD CACHE TEST")
+    print("="*50)
+
+    try:
+        test_cache_key()
+        test_bar_rollover()
+        test_empty_and_corrupt_files()
+
+        print("🎉 ALL TESTS COMPLETED SUCCESSFULLY!")
+
+    except Exception as e:
+        print(f"❌ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+
+if __name__ == "__main__":
+    main()
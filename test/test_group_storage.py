@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+Test script for SymbolGroupManager storage modes
+"""
+
+import sys
+import os
+import gc
+import json
+import tempfile
+import weakref
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utility import symbol_groups_manager
+from utility.symbol_groups_manager import SymbolGroupManager, GroupTemplates, create_predefined_groups
+
+def _read(path):
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def test_per_group_files():
+    """Test that per-group storage writes one file per group plus an index."""
+    print("🧪 Testing per-group storage...")
+
+    with tempfile.TemporaryDirectory() as storage:
+        manager = SymbolGroupManager(storage, per_group_files=True)
+        manager.create_group("Majors", group_id="majors")
+        manager.create_group("Tech", group_id="tech")
+        manager.add_symbol_to_group("majors", "eurusd", "eurusd", "forex", "1h", "7d")
+
+        assert _read(os.path.join(storage, "index.json"))["group_ids"] == ["majors", "tech"]
+        assert "eurusd" in _read(manager._group_file("majors"))["symbols"]
+        assert not os.path.exists(manager.groups_file)
+        print("   ✅ Group files and index written")
+
+        # A symbol change only rewrites the group it belongs to
+        tech_mtime = os.stat(manager._group_file("tech")).st_mtime_ns
+        manager.update_symbol_in_group("majors", "eurusd", timeframe="4h")
+        assert _read(manager._group_file("majors"))["symbols"]["eurusd"]["timeframe"] == "4h"
+        assert os.stat(manager._group_file("tech")).st_mtime_ns == tech_mtime
+        print("   ✅ Untouched group file left alone")
+
+        # A direct edit to one group is written when another group is saved
+        manager.get_group("tech").description = "changed"
+        manager.update_group("majors", description="Major forex pairs")
+        assert _read(manager._group_file("tech"))["description"] == "changed"
+        print("   ✅ Direct change written with another group's save")
+
+        manager.delete_group("tech")
+        assert not os.path.exists(manager._group_file("tech"))
+
+        reloaded = SymbolGroupManager(storage, per_group_files=True)
+        assert [g.group_id for g in reloaded.list_groups()] == ["majors"]
+        assert reloaded.get_group("majors").symbols["eurusd"].timeframe == "4h"
+        print("   ✅ Groups reloaded from per-group files")
+
+    print("   ✅ Per-group storage test completed\n")
+
+def test_dirty_groups():
+    """Test that only the groups changed since the last write are marked dirty."""
+    print("🧪 Testing dirty group tracking...")
+
+    with tempfile.TemporaryDirectory() as storage:
+        manager = SymbolGroupManager(storage, per_group_files=True)
+        manager.create_group("Majors", group_id="majors")
+        manager.create_group("Tech", group_id="tech")
+
+        with manager.batch_updates():
+            manager.update_group("majors", description="Major forex pairs")
+            manager.configure_group_scheduler("majors", True, run_interval=30)
+            assert manager._dirty_groups == {"majors"}
+        assert not manager._dirty_groups
+        print("   ✅ Only the changed group was queued")
+
+        with manager.batch_updates():
+            manager.delete_group("majors")
+            assert not manager._dirty_groups
+        assert [g.group_id for g in SymbolGroupManager(storage, per_group_files=True).list_groups()] == ["tech"]
+        print("   ✅ Deleted group dropped from storage")
+
+        # A failed write at the end of a batch stays pending and is reported by flush()
+        manager._flush_now = lambda: False
+        with manager.batch_updates():
+            assert manager.update_group("tech", description="Tech stocks")
+        assert not manager.flush()
+        print("   ✅ Failed batch write reported by flush()")
+
+    print("   ✅ Dirty group tracking test completed\n")
+
+def test_recent_first_listing():
+    """Test listing groups with the most recently updated first."""
+    print("🧪 Testing recently updated ordering...")
+
+    with tempfile.TemporaryDirectory() as storage:
+        manager = SymbolGroupManager(storage)
+        for group_id in ("majors", "tech", "crypto"):
+            manager.create_group(group_id.title(), group_id=group_id)
+
+        manager.update_group("majors", description="Major forex pairs")
+        assert [g.group_id for g in manager.list_groups(recent_first=True)] == ["majors", "crypto", "tech"]
+        assert [g.group_id for g in manager.list_groups()] == ["majors", "tech", "crypto"]
+
+        manager.add_symbol_to_group("tech", "aapl", "AAPL", "stocks", "30m", "5d")
+        manager.delete_group("crypto")
+        assert [g.group_id for g in manager.list_groups(recent_first=True)] == ["tech", "majors"]
+        print("   ✅ Most recently updated groups listed first")
+
+    print("   ✅ Recently updated ordering test completed\n")
+
+def test_unchanged_update_skips_save():
+    """Test that updates repeating the stored values do not touch the group."""
+    print("🧪 Testing no-op updates...")
+
+    with tempfile.TemporaryDirectory() as storage:
+        manager = SymbolGroupManager(storage)
+        manager.create_group("Majors", group_id="majors")
+        manager.add_symbol_to_group("majors", "eurusd", "eurusd", "forex", "1h", "7d")
+        updated_at = manager.get_group("majors").updated_at
+
+        assert manager.update_group("majors", name="Majors")
+        assert manager.update_symbol_in_group("majors", "eurusd", timeframe="1h", period="7d")
+        assert not manager._dirty
+        assert manager.get_group("majors").updated_at == updated_at
+        print("   ✅ Repeated values left the group untouched")
+
+        assert manager.update_symbol_in_group("majors", "eurusd", timeframe="4h")
+        assert _read(manager.groups_file)["groups"][0]["symbols"]["eurusd"]["timeframe"] == "4h"
+        print("   ✅ Real change still saved")
+
+        # Objects edited in place and passed back are saved even though they equal themselves
+        settings = manager.get_group("majors").symbols["eurusd"].indicator_settings
+        settings.rsi_period = 7
+        assert manager.update_symbol_in_group("majors", "eurusd", indicator_settings=settings)
+        tags = manager.get_group("majors").tags
+        tags.append("forex")
+        assert manager.update_group("majors", tags=tags)
+        reloaded = SymbolGroupManager(storage).get_group("majors")
+        assert reloaded.symbols["eurusd"].indicator_settings.rsi_period == 7
+        assert reloaded.tags == ["forex"]
+        print("   ✅ In-place edits passed back are saved")
+
+    print("   ✅ No-op update test completed\n")
+
+def test_direct_group_changes_saved():
+    """Test that changes made directly to groups are written by the next save."""
+    print("🧪 Testing direct group changes...")
+
+    with tempfile.TemporaryDirectory() as storage:
+        manager = SymbolGroupManager(storage)
+        manager.create_group("Majors", group_id="majors")
+        manager.create_group("Tech", group_id="tech")
+        manager.add_symbol_to_group("tech", "aapl", "AAPL", "stocks", "30m", "5d")
+        manager.flush()
+
+        manager.get_group("majors").description = "changed"
+        manager.get_group("tech").symbols["aapl"].enabled = False
+        manager.update_group("tech", description="Tech stocks")
+        manager.flush()
+
+        reloaded = SymbolGroupManager(storage)
+        assert reloaded.get_group("majors").description == "changed"
+        assert reloaded.get_group("tech").description == "Tech stocks"
+        assert reloaded.get_group("tech").symbols["aapl"].enabled is False
+        print("   ✅ Direct changes saved along with a managed update")
+
+        manager.get_group("tech").enabled = False
+        manager._save_all_groups()
+        assert _read(manager.groups_file)["groups"][1]["enabled"] is False
+        print("   ✅ Direct changes written after _save_all_groups()")
+
+    print("   ✅ Direct group changes test completed\n")
+
+def test_flush_interval():
+    """Test deferred writes and that immediate-write managers can be collected."""
+    print("🧪 Testing flush interval...")
+
+    with tempfile.TemporaryDirectory() as storage:
+        manager = SymbolGroupManager(storage, flush_interval=3600)
+        manager.create_group("Majors", group_id="majors")
+        manager.create_group("Tech", group_id="tech")
+        assert [g["group_id"] for g in _read(manager.groups_file)["groups"]] == ["majors"]
+        manager.flush()
+        assert [g["group_id"] for g in _read(manager.groups_file)["groups"]] == ["majors", "tech"]
+        print("   ✅ Writes inside the interval deferred until flush()")
+
+        # Nothing is pending without an interval, so no exit hook keeps the manager alive
+        ref = weakref.ref(SymbolGroupManager(storage))
+        gc.collect()
+        assert ref() is None
+        print("   ✅ Manager without an interval garbage collected")
+
+    print("   ✅ Flush interval test completed\n")
+
+def test_lazy_loading():
+    """Test that groups are only read from storage when first needed."""
+    print("🧪 Testing lazy loading...")
+
+    with tempfile.TemporaryDirectory() as storage:
+        manager = SymbolGroupManager(storage, per_group_files=True)
+        manager.create_group("Majors", group_id="majors")
+        manager.create_group("Tech", group_id="tech")
+
+        reloaded = SymbolGroupManager(storage, per_group_files=True)
+        assert not reloaded._loaded
+        majors = reloaded.get_group("majors")
+        assert majors.name == "Majors"
+        assert not reloaded._loaded and list(reloaded._groups) == ["majors"]
+        print("   ✅ Single group read without loading the rest")
+
+        assert [g.group_id for g in reloaded.list_groups()] == ["majors", "tech"]
+        assert reloaded.get_group("majors") is majors
+        print("   ✅ Full load keeps groups already handed out")
+
+    print("   ✅ Lazy loading test completed\n")
+
+def test_bulk_symbol_add():
+    """Test adding many symbols with a single save."""
+    print("🧪 Testing bulk symbol add...")
+
+    with tempfile.TemporaryDirectory() as storage:
+        manager = SymbolGroupManager(storage)
+        manager.create_group("Tech", group_id="tech")
+        writes = []
+        flush_now = manager._flush_now
+        manager._flush_now = lambda: writes.append(1) or flush_now()
+
+        symbols = GroupTemplates.create_tech_stocks()
+        assert manager.add_symbols_to_group("tech", symbols.items())
+        assert len(writes) == 1
+        assert list(_read(manager.groups_file)["groups"][0]["symbols"]) == list(symbols)
+        assert not manager.add_symbols_to_group("missing", symbols.items())
+        print(f"   ✅ {len(symbols)} symbols added with one write")
+
+        created = create_predefined_groups(SymbolGroupManager(storage))
+        assert "forex_majors" in created
+        assert len(SymbolGroupManager(storage).get_group("forex_majors").symbols) == 7
+        print("   ✅ Predefined groups created")
+
+    print("   ✅ Bulk symbol add test completed\n")
+
+def test_compressed_groups_file():
+    """Test storing the groups file gzip-compressed."""
+    print("🧪 Testing compressed storage...")
+
+    with tempfile.TemporaryDirectory() as storage:
+        SymbolGroupManager(storage).create_group("Majors", group_id="majors")
+
+        manager = SymbolGroupManager(storage, compression="gzip")
+        assert manager.groups_file.endswith("groups.json.gz")
+        assert [g.group_id for g in manager.list_groups()] == ["majors"]
+        manager.flush()
+        assert os.path.exists(manager.groups_file)
+        # The old file is kept only as a backup so nothing reads it as current
+        assert not os.path.exists(os.path.join(storage, "groups.json"))
+        assert os.path.exists(os.path.join(storage, "groups.json.bak"))
+        print("   ✅ groups.json migrated to groups.json.gz")
+
+        manager.add_symbol_to_group("majors", "eurusd", "eurusd", "forex", "1h", "7d")
+        reloaded = SymbolGroupManager(storage, compression="gzip")
+        assert "eurusd" in reloaded.get_group("majors").symbols
+        print("   ✅ Compressed groups file reloaded")
+
+    print("   ✅ Compressed storage test completed\n")
+
+def test_non_finite_floats():
+    """Test that NaN and infinities are written as null with and without orjson."""
+    print("🧪 Testing non-finite float values...")
+
+    def strict(constant):
+        raise ValueError(f"{constant} written to the groups file")
+
+    saved = []
+    for use_orjson in (True, False):
+        saved_orjson = symbol_groups_manager.orjson
+        if not use_orjson:
+            symbol_groups_manager.orjson = None
+        try:
+            with tempfile.TemporaryDirectory() as storage:
+                manager = SymbolGroupManager(storage)
+                group = manager.create_group("Majors", group_id="majors")
+                indicators = group.group_settings.default_indicator_settings
+                indicators.rsi_overbought = float("nan")
+                indicators.bb_std = float("inf")
+                manager.save_group(group)
+                with open(manager.groups_file, 'r') as f:
+                    data = json.load(f, parse_constant=strict)
+        finally:
+            symbol_groups_manager.orjson = saved_orjson
+        settings = data["groups"][0]["group_settings"]["default_indicator_settings"]
+        assert settings["rsi_overbought"] is None and settings["bb_std"] is None
+        saved.append(settings)
+    assert saved[0] == saved[1]
+    print("   ✅ NaN and inf written as null by both encoders")
+
+    print("   ✅ Non-finite float test completed\n")
+
+def test_alert_and_scheduler_lookup():
+    """Test that alert and scheduler group lookups follow manager changes."""
+    print("🧪 Testing alert and scheduler group lookup...")
+
+    with tempfile.TemporaryDirectory() as storage:
+        manager = SymbolGroupManager(storage)
+        manager.create_group("Majors", group_id="majors")
+        manager.create_group("Tech", group_id="tech")
+        manager.add_symbol_to_group("majors", "eurusd", "eurusd", "forex", "1h", "7d")
+        assert manager.get_groups_with_alerts() == []
+
+        manager.setup_first_time_alerts("majors", "eurusd", interval=30)
+        manager.configure_group_scheduler("tech", True)
+        assert [g.group_id for g in manager.get_groups_with_alerts()] == ["majors"]
+        assert [g.group_id for g in manager.get_groups_with_scheduler()] == ["tech"]
+        print("   ✅ Configured groups found")
+
+        manager.remove_symbol_from_group("majors", "eurusd")
+        manager.update_group("tech", enabled=False)
+        assert manager.get_groups_with_alerts() == []
+        assert manager.get_groups_with_scheduler() == []
+        print("   ✅ Groups dropped after changes")
+
+        # In-place toggles are seen without a save, as the CLI's alert menu makes them
+        manager.add_symbol_to_group("majors", "gbpusd", "gbpusd", "forex", "1h", "7d")
+        manager.setup_first_time_alerts("majors", "gbpusd", interval=30)
+        manager.get_group("majors").symbols["gbpusd"].periodic_alerts.enabled = False
+        assert manager.get_groups_with_alerts() == []
+        manager.get_group("tech").group_settings.scheduler_settings["enabled"] = True
+        manager.get_group("tech").enabled = True
+        assert [g.group_id for g in manager.get_groups_with_scheduler()] == ["tech"]
+        print("   ✅ Unsaved in-place changes picked up")
+
+    print("   ✅ Alert and scheduler lookup test completed\n")
+
+def test_migrate_to_per_group_files():
+    """Test that an existing groups.json is carried over to per-group storage."""
+    print("🧪 Testing migration to per-group storage...")
+
+    with tempfile.TemporaryDirectory() as storage:
+        manager = SymbolGroupManager(storage)
+        manager.create_group("Majors", group_id="majors")
+
+        migrated = SymbolGroupManager(storage, per_group_files=True)
+        assert [g.group_id for g in migrated.list_groups()] == ["majors"]
+        migrated.flush()
+        assert os.path.exists(migrated._group_file("majors"))
+        assert not os.path.exists(os.path.join(storage, "groups.json"))
+        assert os.path.exists(os.path.join(storage, "groups.json.bak"))
+
+        reloaded = SymbolGroupManager(storage, per_group_files=True)
+        assert [g.group_id for g in reloaded.list_groups()] == ["majors"]
+        print("   ✅ groups.json migrated")
+
+    print("   ✅ Migration test completed\n")
+
+def main():
+    """Run all storage tests."""
+    print("🚀 SYMBOL GROUP STORAGE TEST")
+    print("="*50)
+
+    try:
+        test_per_group_files()
+        test_dirty_groups()
+        test_recent_first_listing()
+        test_unchanged_update_skips_save()
+        test_direct_group_changes_saved()
+        test_flush_interval()
+        test_lazy_loading()
+        test_bulk_symbol_add()
+        test_compressed_groups_file()
+        test_non_finite_floats()
+        test_alert_and_scheduler_lookup()
+        test_migrate_to_per_group_files()
+
+        print("🎉 ALL TESTS COMPLETED SUCCESSFULLY!")
+
+    except Exception as e:
+        print(f"❌ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Test script for oscillator status rating
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from utility.indicators_oscillators import Oscillator_Status, STATUS_BANDS, STATUS_ZERO_LINES
+from utility.us30_analysis import _oscillator_statuses, _OSCILLATOR_STATUS_NAMES
+
+def _edge_values():
+    """Thresholds, values just either side of them, NaN and infinities."""
+    values = [np.nan, np.inf, -np.inf, 0.0, 1e9, -1e9]
+    thresholds = [bound for bounds in STATUS_BANDS.values() for bound in bounds]
+    thresholds += [tolerance for tolerance, _ in STATUS_ZERO_LINES.values()]
+    for threshold in thresholds:
+        for value in (threshold, -threshold):
+            values += [value, np.nextafter(value, np.inf), np.nextafter(value, -np.inf)]
+    return values
+
+def test_vectorized_status_parity():
+    """Test that the NumPy status pass agrees with Oscillator_Status.get_status."""
+    print("🧪 Testing vectorized oscillator status parity...")
+
+    values = _edge_values()
+    for name in _OSCILLATOR_STATUS_NAMES.values():
+        expected = [Oscillator_Status.get_status(value, name) for value in values]
+        assert _oscillator_statuses([name] * len(values), values) == expected, name
+        print(f"   ✅ {name}: {len(values)} values match")
+
+    # Mixed oscillators in one call, as get_oscillator_status rates them
+    names = list(_OSCILLATOR_STATUS_NAMES.values())
+    row = [STATUS_BANDS.get(name, (0, 0))[1] + 1 for name in names]
+    assert _oscillator_statuses(names, row) == [Oscillator_Status.get_status(v, n) for n, v in zip(names, row)]
+    print("   ✅ Mixed oscillator row matches")
+
+    print("   ✅ Vectorized oscillator status parity test completed\n")
+
+def main():
+    """Run all oscillator status tests."""
+    print("🚀 OSCILLATOR STATUS TEST")
+    print("="*50)
+
+    try:
+        test_vectorized_status_parity()
+
+        print("🎉 ALL TESTS COMPLETED SUCCESSFULLY!")
+
+    except Exception as e:
+        print(f"❌ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+
+if __name__ == "__main__":
+    main()
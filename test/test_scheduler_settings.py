@@ -150,8 +150,55 @@ def test_weekday_names():
     else:
         print(f"   ❌ Expected {expected_numbers}, got {scheduler.active_weekdays}")
     
+    # Unknown day names are rejected with KeyError
+    try:
+        scheduler.update_weekdays_from_names({"Funday": True})
+        assert False, "expected KeyError for an unknown day name"
+    except KeyError:
+        print("   ✅ Unknown day name raises KeyError")
+    assert scheduler.active_weekdays == expected_numbers
+    
+    # is_active_now only runs on active weekdays
+    all_day = SymbolSchedulerSettings(
+        use_group_settings=False,
+        time_windows=[TimeWindowSlot("00:00", "23:59", timezone="UTC")],
+        timezone="UTC",
+        enabled=True
+    )
+    today = datetime.now(pytz.UTC).weekday()
+    all_day.active_weekdays = [today]
+    assert all_day.is_active_now()
+    all_day.active_weekdays = [day for day in range(7) if day != today] + [today + 7, today - 7]
+    assert not all_day.is_active_now()
+    print("   ✅ is_active_now follows active weekdays")
+    
     print("   ✅ Weekday names test completed\n")
 
+def test_computed_fields_refresh():
+    """Test that human-readable fields follow changes to the underlying data."""
+    print("🧪 Testing computed field refresh...")
+    
+    scheduler = SymbolSchedulerSettings(
+        active_weekdays=[0, 1],
+        time_windows=[TimeWindowSlot("09:00", "11:30")]
+    )
+    
+    assert scheduler.get_active_weekday_names() == ["Monday", "Tuesday"]
+    assert scheduler.time_window_descriptions == ["9:00 AM - 11:30 AM"]
+    
+    scheduler.update_weekdays_from_names({"Friday": True, "Saturday": True})
+    assert scheduler.get_active_weekday_names() == ["Friday", "Saturday"]
+    print(f"   ✅ Weekday names refreshed: {', '.join(scheduler.get_active_weekday_names())}")
+    
+    scheduler.add_time_window("20:00", "22:00")
+    assert scheduler.time_window_descriptions == ["9:00 AM - 11:30 AM", "8:00 PM - 10:00 PM"]
+    
+    scheduler.remove_time_window(0)
+    assert scheduler.time_window_descriptions == ["8:00 PM - 10:00 PM"]
+    print(f"   ✅ Time descriptions refreshed: {scheduler.time_window_descriptions}")
+    
+    print("   ✅ Computed field refresh test completed\n")
+
 def test_symbol_group_integration():
     """Test integration with SymbolGroupManager."""
     print("🧪 Testing SymbolGroup integration...")
@@ -261,6 +308,7 @@ def main():
         test_symbol_scheduler_settings()
         test_time_parsing()
         test_weekday_names()
+        test_computed_fields_refresh()
         test_json_serialization()
         test_symbol_group_integration()
         
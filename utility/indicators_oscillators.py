@@ -21,7 +21,12 @@ class Oscillator:
         return self.df[['%K', '%D']]
 
     def cci_20(self):
-        tp = (self.df['high'] + self.df['low'] + self.df['close']) / 3
+        # Typical price accumulated in one buffer instead of three temporary Series
+        tp = self.df['high'].to_numpy(dtype=np.float64, copy=True)
+        tp += self.df['low'].to_numpy(dtype=np.float64)
+        tp += self.df['close'].to_numpy(dtype=np.float64)
+        tp /= 3
+        tp = pd.Series(tp, index=self.df.index)
         sma = tp.rolling(window=20).mean()
         mean_dev = (tp - sma).abs().rolling(window=20).mean()
         self.df['CCI_20'] = (tp - sma) / (0.015 * mean_dev)
@@ -101,8 +106,10 @@ class Oscillator:
         self.df['Signal_Line'] = self.df['MACD'].ewm(span=9, adjust=False).mean()
         return self.df[['MACD', 'Signal_Line']]
 
-    def stochastic_rsi(self):
-        rsi = self.rsi_14()
+    def stochastic_rsi(self, rsi=None):
+        # Callers that already hold RSI(14) can pass it in to skip recomputing it
+        if rsi is None:
+            rsi = self.rsi_14()
         rsi_min = rsi.rolling(window=14).min()
         rsi_max = rsi.rolling(window=14).max()
         self.df['Stoch_RSI'] = (rsi - rsi_min) / (rsi_max - rsi_min)
@@ -134,80 +141,66 @@ class Oscillator:
         self.df['UO'] = (4 * avg7 + 2 * avg14 + avg28) / 7 * 100
         return self.df['UO']
 
-class Oscillator_Status:
-    @staticmethod
-    def get_status(value, indicator, prev_value=None):
-        if indicator == 'RSI_14':
-            if value > 70:
-                return 'Sell'
-            elif value < 30:
-                return 'Buy'
-            else:
-                return 'Neutral'
-
-        elif indicator == '%K':
-            if value > 80:
-                return 'Sell'
-            elif value < 20:
-                return 'Buy'
-            else:
-                return 'Neutral'
-
-        elif indicator == 'CCI_20':
-            if value > 100:
-                return 'Sell'
-            elif value < -100:
-                return 'Buy'
-            else:
-                return 'Neutral'
-
-        elif indicator == 'Stoch_RSI':
-            if value > 0.8:
-                return 'Sell'
-            elif value < 0.2:
-                return 'Buy'
-            else:
-                return 'Neutral'
+# indicator name -> (low, high): Sell above high, Buy below low
+STATUS_BANDS = {
+    'RSI_14': (30, 70),
+    '%K': (20, 80),
+    'CCI_20': (-100, 100),
+    'Stoch_RSI': (0.2, 0.8),
+    '%R': (-80, -20),
+    'UO': (30, 70)
+}
+# indicator name -> (tolerance, whether a value exactly at the tolerance counts as zero)
+STATUS_ZERO_LINES = {
+    'Bull_Power': (0.05, False),
+    'Bear_Power': (0.05, False),
+    'MACD': (0.02, True)
+}
+
+def _band_status(low, high):
+    """Status rule for oscillators that are Sell above `high` and Buy below `low`."""
+    def status(value, prev_value=None):
+        if value > high:
+            return 'Sell'
+        elif value < low:
+            return 'Buy'
+        else:
+            return 'Neutral'
+    return status
 
-        elif indicator == '%R':
-            if value > -20:
-                return 'Sell'
-            elif value < -80:
-                return 'Buy'
-            else:
-                return 'Neutral'
+def _zero_line_status(tolerance, inclusive):
+    """Status rule for oscillators that are Neutral near zero and otherwise follow their sign."""
+    def status(value, prev_value=None):
+        magnitude = abs(value)
+        if magnitude <= tolerance if inclusive else magnitude < tolerance:
+            return 'Neutral'
+        return 'Buy' if value > 0 else 'Sell'
+    return status
 
-        elif indicator == 'Bull_Power' or indicator == 'Bear_Power':
-            if abs(value) < 0.05:
-                return 'Neutral'
-            elif value > 0:
-                return 'Buy'
-            else:
-                return 'Sell'
-
-        elif indicator == 'UO':
-            if value > 70:
-                return 'Sell'
-            elif value < 30:
-                return 'Buy'
-            else:
-                return 'Neutral'
+def _dmi_trend_status(value, prev_value=None):
+    if np.isclose(value, 0, atol=0.0001):
+        return 'Neutral'
+    if prev_value is not None and value > prev_value:
+        return 'Buy'
+    elif prev_value is not None and value < prev_value:
+        return 'Sell'
+    return 'Neutral'
 
-        elif indicator == 'MACD':
-            if np.isclose(value, 0, atol=0.02):
-                return 'Neutral'
-            return 'Buy' if value > 0 else 'Sell'
+class Oscillator_Status:
+    # indicator name -> status(value, prev_value), so get_status is one dict lookup
+    HANDLERS = {
+        **{name: _band_status(low, high) for name, (low, high) in STATUS_BANDS.items()},
+        **{name: _zero_line_status(tolerance, inclusive)
+           for name, (tolerance, inclusive) in STATUS_ZERO_LINES.items()},
+        'DMI': _dmi_trend_status
+    }
 
-        elif indicator == 'DMI':
-            if np.isclose(value, 0, atol=0.0001):
-                return 'Neutral'
-            if prev_value is not None and value > prev_value:
-                return 'Buy'
-            elif prev_value is not None and value < prev_value:
-                return 'Sell'
+    @staticmethod
+    def get_status(value, indicator, prev_value=None):
+        handler = Oscillator_Status.HANDLERS.get(indicator)
+        if handler is None:
             return 'Neutral'
-
-        return 'Neutral'
+        return handler(value, prev_value)
 
     @staticmethod
     def dmi_status(dmi_df):
@@ -223,6 +216,11 @@ class Oscillator_Status:
         # curr_value = dmi_df.loc[-1, '+DI'] - dmi_df.loc[-1, '-DI']
         # prev_value = dmi_df.loc[-2, '+DI'] - dmi_df.loc[-2, '-DI']
 
+        return Oscillator_Status.dmi_status_scalar(curr_value, prev_value)
+
+    @staticmethod
+    def dmi_status_scalar(curr_value, prev_value):
+        # Same rule as dmi_status, for callers that already hold the two values
         if np.isclose(curr_value, 0, atol=0.0001):
                 return 'Neutral'
         elif curr_value > prev_value:
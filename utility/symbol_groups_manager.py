@@ -5,15 +5,195 @@ This module provides a comprehensive CRUD system for managing symbol groups.
 Each group can contain multiple symbols with different timeframes and data sources.
 """
 
+import atexit
+import gzip
 import json
+import logging
+import math
+import mmap
 import os
+import re
+import sys
+import time
 import uuid
-from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Any, Tuple, Union
+from urllib.parse import quote
 import pandas as pd
-from dataclasses import dataclass, asdict, field
+import pytz
+from dataclasses import dataclass, field, fields, replace
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+# Use orjson for faster group file (de)serialization when available
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+# zstd is preferred for compressed group storage; gzip is used when it is missing
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Compression option -> suffix appended to the groups file name
+_COMPRESSION_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+# Matches user-friendly time ranges like "8 AM - 1 PM" or "8:30 AM - 1:45 PM"
+_TIME_DESC_RE = re.compile(r'(\d{1,2}):?(\d{0,2})\s*(AM|PM)\s*-\s*(\d{1,2}):?(\d{0,2})\s*(AM|PM)')
+
+@lru_cache(maxsize=None)
+def _time_to_minutes(hhmm: str) -> int:
+    """Convert an "HH:MM" 24-hour string to minutes since midnight."""
+    hour, minute = hhmm.split(':')
+    hour, minute = int(hour), int(minute)
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        raise ValueError(f"Invalid time: {hhmm}")
+    return hour * 60 + minute
+
+def _minutes_to_12h(minutes: int) -> str:
+    """Format minutes since midnight as "H:MM AM/PM"."""
+    hour, minute = divmod(minutes, 60)
+    period = "AM" if hour < 12 else "PM"
+    return f"{hour % 12 or 12}:{minute:02d} {period}"
+
+# Files at least this large are parsed straight from a memory map
+_MMAP_THRESHOLD = 1 << 20
+
+def _read_json(path: str) -> Any:
+    """Read and parse a JSON file, decompressing .gz and .zst files."""
+    if path.endswith('.gz'):
+        with gzip.open(path, 'rb') as f:
+            return _json_loads(f.read())
+    if path.endswith('.zst'):
+        if zstandard is None:
+            raise ImportError(f"zstandard is required to read {path}")
+        with open(path, 'rb') as f:
+            return _json_loads(zstandard.ZstdDecompressor().decompress(f.read()))
+    
+    with open(path, 'rb') as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+            # orjson parses from any buffer, so large files skip the read() copy
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+        return _json_loads(f.read())
+
+def _write_json(path: str, data: Any) -> None:
+    """Atomically write data to path as JSON indented by two spaces.
+    
+    Paths ending in .gz or .zst are compressed and written without indentation.
+    """
+    _write_payload(path, _encode_json(path, data))
+
+def _encode_json(path: str, data: Any) -> bytes:
+    """The bytes _write_json stores at path for data."""
+    compressed = path.endswith(('.gz', '.zst'))
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS if compressed else orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        payload = orjson.dumps(data, option=option)
+    else:
+        # Encode in memory first: json.dump() issues one write() per token
+        payload = json.dumps(_finite_floats(data), indent=None if compressed else 2,
+                             allow_nan=False).encode('utf-8')
+    
+    if path.endswith('.gz'):
+        payload = gzip.compress(payload)
+    elif path.endswith('.zst'):
+        payload = zstandard.ZstdCompressor(level=3).compress(payload)
+    return payload
+
+def _finite_floats(value: Any) -> Any:
+    """Copy of value with NaN and infinities replaced by None, as orjson writes them."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite_floats(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite_floats(item) for item in value]
+    return value
+
+def _write_payload(path: str, payload: bytes) -> None:
+    """Atomically write already encoded bytes to path."""
+    # Write a sibling temp file and rename it over the target so a crash
+    # mid-write never leaves a truncated file behind
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+# Values that cannot be edited in place, so an equal one is safe to skip saving
+_IMMUTABLE_SCALARS = (str, int, float, bool, type(None))
+
+def _same_scalar(current: Any, value: Any) -> bool:
+    """True when value is an immutable scalar equal to current, so assigning it changes nothing.
+    
+    Objects, dicts and lists always count as changed: the caller may have edited
+    the stored object in place and passed it back.
+    """
+    return isinstance(value, _IMMUTABLE_SCALARS) and type(current) is type(value) and current == value
+
+_WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_WEEKDAY_NUMBERS = {name: day for day, name in enumerate(_WEEKDAY_NAMES)}
+
+def _weekday_mask(weekdays: List[int]) -> int:
+    """Encode weekday numbers (0=Monday, 6=Sunday) as a 7-bit mask."""
+    mask = 0
+    for day in weekdays:
+        if 0 <= day < 7:
+            mask |= 1 << day
+    return mask
+
+@lru_cache(maxsize=None)
+def _get_timezone(name: str):
+    """Resolve a timezone name once and reuse the tzinfo object."""
+    return pytz.timezone(name)
+
+_now_iso_cache = (None, "")  # (epoch second, formatted "YYYY-MM-DDTHH:MM:SS")
+
+def _now_iso() -> str:
+    """Equivalent of datetime.now().isoformat() that reuses the formatted second."""
+    global _now_iso_cache
+    second, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _now_iso_cache
+    if cached_second != second:
+        prefix = datetime.fromtimestamp(second).isoformat()
+        _now_iso_cache = (second, prefix)
+    micros = nanos // 1000
+    return f"{prefix}.{micros:06d}" if micros else prefix
+
+# from_dict() builds its keyword arguments by iterating these cached names
+# instead of passing the decoded dict straight to the constructor: the field
+# names are interned, so the generated __init__ binds them by identity rather
+# than by comparing the key strings produced by the JSON decoder.
+_FIELDS_CACHE: Dict[type, tuple] = {}
+
+def _cached_fields(cls) -> tuple:
+    """Return the init field names of a dataclass, computed once per class."""
+    names = _FIELDS_CACHE.get(cls)
+    if names is None:
+        names = _FIELDS_CACHE[cls] = tuple(f.name for f in fields(cls) if f.init)
+    return names
+
+def _flat_asdict(obj) -> Dict[str, Any]:
+    """asdict() for dataclasses whose fields are scalars or flat lists/dicts."""
+    result = {}
+    for name in _cached_fields(type(obj)):
+        value = getattr(obj, name)
+        if isinstance(value, (list, dict)):
+            value = value.copy()
+        result[name] = value
+    return result
+
+@dataclass(slots=True)
 class IndicatorSettings:
     """Settings for technical indicators on a symbol."""
     rsi_period: int = 14
@@ -46,14 +226,22 @@ class IndicatorSettings:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        return _flat_asdict(self)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'IndicatorSettings':
         """Create from dictionary."""
-        return cls(**data)
+        kwargs = {k: data[k] for k in _cached_fields(cls) if k in data}
+        # The same few strategy names repeat on every symbol; share one string per name
+        if isinstance(kwargs.get("timeframe_strategy"), str):
+            kwargs["timeframe_strategy"] = sys.intern(kwargs["timeframe_strategy"])
+        return cls(**kwargs)
+    
+    def copy(self) -> 'IndicatorSettings':
+        """Create an independent copy without a dict round-trip."""
+        return replace(self, sma_periods=list(self.sma_periods), ema_periods=list(self.ema_periods))
 
-@dataclass
+@dataclass(slots=True)
 class TimeWindowSlot:
     """Represents a time window slot for symbol execution."""
     start_time: str  # Format: "HH:MM" (24-hour format)
@@ -63,28 +251,24 @@ class TimeWindowSlot:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        return _flat_asdict(self)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'TimeWindowSlot':
         """Create from dictionary."""
-        return cls(**data)
+        return cls(**{k: data[k] for k in _cached_fields(cls) if k in data})
     
     def is_active_now(self) -> bool:
         """Check if current time falls within this window."""
-        from datetime import datetime, time
-        import pytz
-        
         try:
             # Get current time in the specified timezone
-            tz = pytz.timezone(self.timezone)
-            current_time = datetime.now(tz).time()
+            tz = _get_timezone(self.timezone)
+            now = datetime.now(tz)
             
-            # Parse start and end times
-            start_parts = self.start_time.split(':')
-            end_parts = self.end_time.split(':')
-            start_time = time(int(start_parts[0]), int(start_parts[1]))
-            end_time = time(int(end_parts[0]), int(end_parts[1]))
+            # Compare as minutes since midnight
+            current_time = now.hour * 60 + now.minute
+            start_time = _time_to_minutes(self.start_time)
+            end_time = _time_to_minutes(self.end_time)
             
             # Handle overnight windows (e.g., 22:00 to 06:00)
             if start_time <= end_time:
@@ -98,7 +282,7 @@ class TimeWindowSlot:
             # If there's any error, assume it's not active
             return False
 
-@dataclass
+@dataclass(slots=True)
 class SymbolSchedulerSettings:
     """Symbol-level scheduler settings that can override group settings."""
     enabled: bool = False
@@ -115,9 +299,17 @@ class SymbolSchedulerSettings:
     _time_window_descriptions: List[str] = field(default=None, init=False, repr=False)
     
     def __post_init__(self):
-        # Generate human-readable fields from the actual data
-        self._weekday_names = self._generate_weekday_names()
-        self._time_window_descriptions = self._generate_time_descriptions()
+        if self.active_weekdays is None:
+            self.active_weekdays = [0, 1, 2, 3, 4]  # Weekdays only
+        if self.time_windows is None:
+            # Default: 11 AM to 4 PM
+            self.time_windows = [
+                TimeWindowSlot("11:00", "16:00", self.timezone, True)
+            ]
+        
+        # Human-readable fields are generated lazily on first access
+        self._weekday_names = None
+        self._time_window_descriptions = None
     
     @property
     def weekday_names(self) -> Dict[str, bool]:
@@ -135,16 +327,8 @@ class SymbolSchedulerSettings:
     
     def _generate_weekday_names(self) -> Dict[str, bool]:
         """Generate human-readable weekday mapping."""
-        weekday_map = {
-            "Monday": 0 in self.active_weekdays,
-            "Tuesday": 1 in self.active_weekdays,
-            "Wednesday": 2 in self.active_weekdays,
-            "Thursday": 3 in self.active_weekdays,
-            "Friday": 4 in self.active_weekdays,
-            "Saturday": 5 in self.active_weekdays,
-            "Sunday": 6 in self.active_weekdays
-        }
-        return weekday_map
+        mask = _weekday_mask(self.active_weekdays)
+        return {name: bool(mask >> day & 1) for day, name in enumerate(_WEEKDAY_NAMES)}
     
     def _generate_time_descriptions(self) -> List[str]:
         """Generate human-readable time window descriptions."""
@@ -157,31 +341,18 @@ class SymbolSchedulerSettings:
     @staticmethod
     def _convert_time_to_description(start_time: str, end_time: str) -> str:
         """Convert 24-hour time to 12-hour AM/PM format."""
-        from datetime import datetime
-        
         try:
-            # Parse start time
-            start_dt = datetime.strptime(start_time, "%H:%M")
-            start_desc = start_dt.strftime("%I:%M %p").lstrip('0')
-            
-            # Parse end time
-            end_dt = datetime.strptime(end_time, "%H:%M")
-            end_desc = end_dt.strftime("%I:%M %p").lstrip('0')
+            start_desc = _minutes_to_12h(_time_to_minutes(start_time))
+            end_desc = _minutes_to_12h(_time_to_minutes(end_time))
             
             return f"{start_desc} - {end_desc}"
-        except:
+        except (ValueError, TypeError, AttributeError):
             return f"{start_time} - {end_time}"
     
     @staticmethod
     def parse_time_description(time_desc: str) -> tuple:
         """Parse user-friendly time like '8 AM - 1 PM' to 24-hour format."""
-        import re
-        from datetime import datetime
-        
-        # Pattern to match formats like "8 AM - 1 PM" or "8:30 AM - 1:45 PM"
-        pattern = r'(\d{1,2}):?(\d{0,2})\s*(AM|PM)\s*-\s*(\d{1,2}):?(\d{0,2})\s*(AM|PM)'
-        
-        match = re.match(pattern, time_desc.upper().strip())
+        match = _TIME_DESC_RE.match(time_desc.upper().strip())
         if not match:
             raise ValueError(f"Invalid time format: {time_desc}. Use format like '8 AM - 1 PM'")
         
@@ -215,28 +386,13 @@ class SymbolSchedulerSettings:
     
     def update_weekdays_from_names(self, weekday_names: Dict[str, bool]):
         """Update active weekdays from name mapping."""
-        name_to_number = {
-            "Monday": 0, "Tuesday": 1, "Wednesday": 2, "Thursday": 3,
-            "Friday": 4, "Saturday": 5, "Sunday": 6
-        }
-        
         # Update the underlying data
         self.active_weekdays = [
-            name_to_number[day] for day, active in weekday_names.items() if active
+            _WEEKDAY_NUMBERS[day] for day, active in weekday_names.items() if active
         ]
         
-        # Regenerate the computed fields
-        self._weekday_names = self._generate_weekday_names()
-        self._time_window_descriptions = self._generate_time_descriptions()
-    
-    def __post_init__(self):
-        if self.active_weekdays is None:
-            self.active_weekdays = [0, 1, 2, 3, 4]  # Weekdays only
-        if self.time_windows is None:
-            # Default: 11 AM to 4 PM
-            self.time_windows = [
-                TimeWindowSlot("11:00", "16:00", self.timezone, True)
-            ]
+        # Invalidate the computed field so it is regenerated on next access
+        self._weekday_names = None
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -245,9 +401,7 @@ class SymbolSchedulerSettings:
             "use_group_settings": self.use_group_settings,
             "run_interval": self.run_interval,
             "active_weekdays": self.active_weekdays,
-            "weekday_names": self.weekday_names,
             "time_windows": [tw.to_dict() for tw in self.time_windows],
-            "time_window_descriptions": self.time_window_descriptions,
             "timezone": self.timezone,
             "priority": self.priority,
             "max_concurrent_runs": self.max_concurrent_runs
@@ -256,42 +410,28 @@ class SymbolSchedulerSettings:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'SymbolSchedulerSettings':
         """Create from dictionary."""
+        kwargs = {k: data[k] for k in _cached_fields(cls) if k in data}
+        
         time_windows = []
         if data.get("time_windows"):
             time_windows = [TimeWindowSlot.from_dict(tw) for tw in data["time_windows"]]
+        kwargs["time_windows"] = time_windows if time_windows else [TimeWindowSlot("11:00", "16:00")]
+        # Note: weekday_names and time_window_descriptions are regenerated lazily on access
         
-        # Use the provided weekdays or defaults
-        active_weekdays = data.get("active_weekdays", [0, 1, 2, 3, 4])
-        
-        instance = cls(
-            enabled=data.get("enabled", False),
-            use_group_settings=data.get("use_group_settings", True),
-            run_interval=data.get("run_interval", 15),
-            active_weekdays=active_weekdays,
-            time_windows=time_windows if time_windows else [TimeWindowSlot("11:00", "16:00")],
-            timezone=data.get("timezone", "UTC"),
-            priority=data.get("priority", 1),
-            max_concurrent_runs=data.get("max_concurrent_runs", 1)
-        )
-        # Note: weekday_names and time_window_descriptions will be auto-generated in __post_init__
-        
-        return instance
+        return cls(**kwargs)
     
     def is_active_now(self) -> bool:
         """Check if the symbol should be active based on current time and day."""
-        from datetime import datetime
-        import pytz
-        
         if not self.enabled or self.use_group_settings:
             return False
         
         try:
             # Check if today is an active weekday
-            tz = pytz.timezone(self.timezone)
+            tz = _get_timezone(self.timezone)
             current_datetime = datetime.now(tz)
             current_weekday = current_datetime.weekday()
             
-            if current_weekday not in self.active_weekdays:
+            if not _weekday_mask(self.active_weekdays) >> current_weekday & 1:
                 return False
             
             # Check if current time falls within any active time window
@@ -311,52 +451,56 @@ class SymbolSchedulerSettings:
         
         time_window = TimeWindowSlot(start_time, end_time, timezone, active)
         self.time_windows.append(time_window)
+        self._time_window_descriptions = None
     
     def remove_time_window(self, index: int) -> bool:
         """Remove a time window by index."""
         if 0 <= index < len(self.time_windows):
             del self.time_windows[index]
+            self._time_window_descriptions = None
             return True
         return False
     
     def get_next_run_time(self) -> Optional[str]:
         """Get the next scheduled run time."""
-        from datetime import datetime, timedelta
-        import pytz
-        
         if not self.enabled or self.use_group_settings:
             return None
         
         try:
-            tz = pytz.timezone(self.timezone)
+            tz = _get_timezone(self.timezone)
             current_datetime = datetime.now(tz)
             
+            # Parse the active window start times once instead of once per day
+            window_starts = [
+                divmod(_time_to_minutes(time_window.start_time), 60)
+                for time_window in self.time_windows if time_window.active
+            ]
+            active_mask = _weekday_mask(self.active_weekdays)
+            
             # Look for next active time window in the next 7 days
             for days_ahead in range(7):
                 check_date = current_datetime + timedelta(days=days_ahead)
                 check_weekday = check_date.weekday()
                 
-                if check_weekday in self.active_weekdays:
-                    for time_window in self.time_windows:
-                        if time_window.active:
-                            start_parts = time_window.start_time.split(':')
-                            window_start = check_date.replace(
-                                hour=int(start_parts[0]),
-                                minute=int(start_parts[1]),
-                                second=0,
-                                microsecond=0
-                            )
-                            
-                            # If this window is in the future, return it
-                            if window_start > current_datetime:
-                                return window_start.isoformat()
+                if active_mask >> check_weekday & 1:
+                    for hour, minute in window_starts:
+                        window_start = check_date.replace(
+                            hour=hour,
+                            minute=minute,
+                            second=0,
+                            microsecond=0
+                        )
+                        
+                        # If this window is in the future, return it
+                        if window_start > current_datetime:
+                            return window_start.isoformat()
             
             return None
             
         except Exception:
             return None
 
-@dataclass
+@dataclass(slots=True)
 class PeriodicAlertConfig:
     """Configuration for periodic alerts on a symbol."""
     enabled: bool = False
@@ -385,14 +529,26 @@ class PeriodicAlertConfig:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        return _flat_asdict(self)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'PeriodicAlertConfig':
         """Create from dictionary."""
-        return cls(**data)
+        return cls(**{k: data[k] for k in _cached_fields(cls) if k in data})
+    
+    def copy(self) -> 'PeriodicAlertConfig':
+        """Create an independent copy without a dict round-trip."""
+        return replace(
+            self,
+            alert_weekdays=list(self.alert_weekdays),
+            alert_hours=list(self.alert_hours),
+            conditions=dict(self.conditions)
+        )
 
-@dataclass
+# SymbolConfig fields that take a handful of distinct values across all symbols
+_SHARED_SYMBOL_FIELDS = ("asset_type", "timeframe", "period", "data_source")
+
+@dataclass(slots=True)
 class SymbolConfig:
     """Configuration for a single symbol within a group."""
     symbol: str
@@ -447,33 +603,27 @@ class SymbolConfig:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'SymbolConfig':
         """Create from dictionary."""
-        indicator_settings = None
-        if data.get("indicator_settings"):
-            indicator_settings = IndicatorSettings.from_dict(data["indicator_settings"])
-        
-        periodic_alerts = None
-        if data.get("periodic_alerts"):
-            periodic_alerts = PeriodicAlertConfig.from_dict(data["periodic_alerts"])
-        
-        symbol_scheduler_settings = None
-        if data.get("symbol_scheduler_settings"):
-            symbol_scheduler_settings = SymbolSchedulerSettings.from_dict(data["symbol_scheduler_settings"])
-        
-        return cls(
-            symbol=data["symbol"],
-            asset_type=data["asset_type"],
-            timeframe=data["timeframe"],
-            period=data["period"],
-            data_source=data.get("data_source", "yfinance"),
-            enabled=data.get("enabled", True),
-            indicator_settings=indicator_settings,
-            periodic_alerts=periodic_alerts,
-            symbol_scheduler_settings=symbol_scheduler_settings,
-            trading_session=data.get("trading_session"),
-            risk_management=data.get("risk_management")
+        kwargs = {k: data[k] for k in _cached_fields(cls) if k in data}
+        # Share one string per value across symbols ("forex", "1h", "yfinance", ...)
+        for key in _SHARED_SYMBOL_FIELDS:
+            value = kwargs.get(key)
+            if type(value) is str:
+                kwargs[key] = sys.intern(value)
+        
+        indicator_settings = data.get("indicator_settings")
+        kwargs["indicator_settings"] = IndicatorSettings.from_dict(indicator_settings) if indicator_settings else None
+        
+        periodic_alerts = data.get("periodic_alerts")
+        kwargs["periodic_alerts"] = PeriodicAlertConfig.from_dict(periodic_alerts) if periodic_alerts else None
+        
+        symbol_scheduler_settings = data.get("symbol_scheduler_settings")
+        kwargs["symbol_scheduler_settings"] = (
+            SymbolSchedulerSettings.from_dict(symbol_scheduler_settings) if symbol_scheduler_settings else None
         )
+        
+        return cls(**kwargs)
 
-@dataclass
+@dataclass(slots=True)
 class GroupLevelSettings:
     """Group-level settings that can be inherited by symbols."""
     default_indicator_settings: Optional[IndicatorSettings] = None
@@ -518,24 +668,21 @@ class GroupLevelSettings:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'GroupLevelSettings':
         """Create from dictionary."""
-        default_indicator_settings = None
-        if data.get("default_indicator_settings"):
-            default_indicator_settings = IndicatorSettings.from_dict(data["default_indicator_settings"])
-        
-        default_periodic_alerts = None
-        if data.get("default_periodic_alerts"):
-            default_periodic_alerts = PeriodicAlertConfig.from_dict(data["default_periodic_alerts"])
-        
-        return cls(
-            default_indicator_settings=default_indicator_settings,
-            default_periodic_alerts=default_periodic_alerts,
-            scheduler_settings=data.get("scheduler_settings"),
-            notification_settings=data.get("notification_settings"),
-            auto_analysis=data.get("auto_analysis", False),
-            analysis_interval=data.get("analysis_interval", 30)
+        kwargs = {k: data[k] for k in _cached_fields(cls) if k in data}
+        
+        default_indicator_settings = data.get("default_indicator_settings")
+        kwargs["default_indicator_settings"] = (
+            IndicatorSettings.from_dict(default_indicator_settings) if default_indicator_settings else None
         )
+        
+        default_periodic_alerts = data.get("default_periodic_alerts")
+        kwargs["default_periodic_alerts"] = (
+            PeriodicAlertConfig.from_dict(default_periodic_alerts) if default_periodic_alerts else None
+        )
+        
+        return cls(**kwargs)
 
-@dataclass
+@dataclass(slots=True)
 class SymbolGroup:
     """A group of symbols with their configurations."""
     group_id: str
@@ -575,35 +722,26 @@ class SymbolGroup:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'SymbolGroup':
         """Create from dictionary."""
-        symbols = {k: SymbolConfig.from_dict(v) for k, v in data['symbols'].items()}
-        
-        group_settings = None
-        if data.get('group_settings'):
-            group_settings = GroupLevelSettings.from_dict(data['group_settings'])
-        
-        return cls(
-            group_id=data['group_id'],
-            name=data['name'],
-            description=data['description'],
-            symbols=symbols,
-            created_at=data['created_at'],
-            updated_at=data['updated_at'],
-            enabled=data.get('enabled', True),
-            tags=data.get('tags', []),
-            metadata=data.get('metadata', {}),
-            group_settings=group_settings
-        )
+        kwargs = {k: data[k] for k in _cached_fields(cls) if k in data}
+        # Bind the nested constructor once for the per-symbol loop
+        symbol_from_dict = SymbolConfig.from_dict
+        kwargs['symbols'] = {k: symbol_from_dict(v) for k, v in data['symbols'].items()}
+        
+        group_settings = data.get('group_settings')
+        kwargs['group_settings'] = GroupLevelSettings.from_dict(group_settings) if group_settings else None
+        
+        return cls(**kwargs)
     
     def add_symbol(self, symbol_key: str, config: SymbolConfig) -> None:
         """Add a symbol to the group."""
         self.symbols[symbol_key] = config
-        self.updated_at = datetime.now().isoformat()
+        self.updated_at = _now_iso()
     
     def remove_symbol(self, symbol_key: str) -> bool:
         """Remove a symbol from the group."""
         if symbol_key in self.symbols:
             del self.symbols[symbol_key]
-            self.updated_at = datetime.now().isoformat()
+            self.updated_at = _now_iso()
             return True
         return False
     
@@ -611,7 +749,7 @@ class SymbolGroup:
         """Update a symbol's configuration."""
         if symbol_key in self.symbols:
             self.symbols[symbol_key] = config
-            self.updated_at = datetime.now().isoformat()
+            self.updated_at = _now_iso()
             return True
         return False
     
@@ -623,7 +761,7 @@ class SymbolGroup:
         """Update indicator settings for a specific symbol."""
         if symbol_key in self.symbols:
             self.symbols[symbol_key].indicator_settings = indicator_settings
-            self.updated_at = datetime.now().isoformat()
+            self.updated_at = _now_iso()
             return True
         return False
     
@@ -631,7 +769,7 @@ class SymbolGroup:
         """Update periodic alert configuration for a specific symbol."""
         if symbol_key in self.symbols:
             self.symbols[symbol_key].periodic_alerts = alert_config
-            self.updated_at = datetime.now().isoformat()
+            self.updated_at = _now_iso()
             return True
         return False
     
@@ -639,7 +777,7 @@ class SymbolGroup:
         """Update scheduler settings for a specific symbol."""
         if symbol_key in self.symbols:
             self.symbols[symbol_key].symbol_scheduler_settings = scheduler_settings
-            self.updated_at = datetime.now().isoformat()
+            self.updated_at = _now_iso()
             return True
         return False
     
@@ -663,12 +801,12 @@ class SymbolGroup:
             "run_weekdays": weekdays,
             "run_hours": hours
         })
-        self.updated_at = datetime.now().isoformat()
+        self.updated_at = _now_iso()
     
     def disable_group_scheduler(self) -> None:
         """Disable scheduler for the entire group."""
         self.group_settings.scheduler_settings["enabled"] = False
-        self.updated_at = datetime.now().isoformat()
+        self.updated_at = _now_iso()
     
     def set_first_time_periodic_alerts_for_symbol(self, symbol_key: str, 
                                                   interval: int = 15,
@@ -692,7 +830,7 @@ class SymbolGroup:
         )
         
         self.symbols[symbol_key].periodic_alerts = alert_config
-        self.updated_at = datetime.now().isoformat()
+        self.updated_at = _now_iso()
         return True
     
     def apply_group_settings_to_symbol(self, symbol_key: str, override_existing: bool = False) -> bool:
@@ -704,23 +842,24 @@ class SymbolGroup:
         
         # Apply group indicator settings if symbol doesn't have custom ones or override is requested
         if not symbol.indicator_settings or override_existing:
-            symbol.indicator_settings = IndicatorSettings.from_dict(
-                self.group_settings.default_indicator_settings.to_dict()
-            )
+            symbol.indicator_settings = self.group_settings.default_indicator_settings.copy()
         
         # Apply group periodic alert settings if symbol doesn't have custom ones or override is requested
         if not symbol.periodic_alerts or override_existing:
-            symbol.periodic_alerts = PeriodicAlertConfig.from_dict(
-                self.group_settings.default_periodic_alerts.to_dict()
-            )
+            symbol.periodic_alerts = self.group_settings.default_periodic_alerts.copy()
         
-        self.updated_at = datetime.now().isoformat()
+        self.updated_at = _now_iso()
         return True
     
     def get_analysis_summary(self) -> Dict[str, Any]:
         """Get a summary of the group's analysis configuration."""
-        enabled_symbols = len(self.get_enabled_symbols())
-        alert_enabled_symbols = len(self.get_symbols_with_alerts_enabled())
+        # Count in a single pass instead of building the filtered dicts
+        enabled_symbols = alert_enabled_symbols = 0
+        for config in self.symbols.values():
+            if config.enabled:
+                enabled_symbols += 1
+                if config.periodic_alerts and config.periodic_alerts.enabled:
+                    alert_enabled_symbols += 1
         
         return {
             "group_id": self.group_id,
@@ -736,46 +875,241 @@ class SymbolGroup:
 class SymbolGroupManager:
     """Manager class for CRUD operations on symbol groups."""
     
-    def __init__(self, storage_path: str = "symbol_groups"):
+    def __init__(self, storage_path: str = "symbol_groups", flush_interval: float = 0.0,
+                 per_group_files: bool = False, compression: Optional[str] = None):
+        """
+        Args:
+            storage_path: Directory holding the groups file
+            flush_interval: Minimum seconds between writes to disk. Saves requested
+                sooner are deferred until the next save after the interval, an
+                explicit flush() or interpreter exit. 0 writes on every change.
+            per_group_files: Store each group in its own file under
+                ``<storage_path>/groups`` plus an ``index.json`` holding the group
+                order, so a change only rewrites the group it touched. An existing
+                groups.json is migrated on the first save.
+            compression: "gzip" or "zstd" to store the groups file compressed as
+                groups.json.gz or groups.json.zst. zstd falls back to gzip when the
+                zstandard package is not installed. An uncompressed groups.json is
+                migrated on the first save. Not supported with per_group_files.
+        """
+        if compression is not None:
+            if compression not in _COMPRESSION_SUFFIXES:
+                raise ValueError(f"Unknown compression '{compression}', expected 'gzip' or 'zstd'")
+            if per_group_files:
+                raise ValueError("compression is only supported for the single groups file")
+            if compression == "zstd" and zstandard is None:
+                compression = "gzip"
+        
         self.storage_path = storage_path
-        self.groups_file = os.path.join(storage_path, "groups.json")
+        self.compression = compression
+        self.groups_file = os.path.join(
+            storage_path, "groups.json" + _COMPRESSION_SUFFIXES.get(compression, ""))
+        self.groups_dir = os.path.join(storage_path, "groups")
+        self.index_file = os.path.join(storage_path, "index.json")
+        self.per_group_files = per_group_files
+        self.flush_interval = flush_interval
         self._ensure_storage_directory()
-        self._groups_cache: Dict[str, SymbolGroup] = {}
-        self._load_all_groups()
+        self._groups: Dict[str, SymbolGroup] = {}
+        self._loaded = False
+        self._dirty = False
+        self._dirty_groups: set = set()
+        self._recent_ids: Optional[Dict[str, None]] = None
+        self._stored_group_ids: List[str] = []
+        # Per-group mode: group ID -> bytes last read from or written to its file
+        self._group_file_payloads: Dict[str, bytes] = {}
+        # Old-layout groups file to retire once its groups are written in the new layout
+        self._legacy_file: Optional[str] = None
+        self._last_flush = float("-inf")
+        self._batch_depth = 0
+        if flush_interval > 0:
+            # Only a flush interval can leave writes pending when the process exits
+            atexit.register(self.flush)
     
     def _ensure_storage_directory(self) -> None:
         """Ensure storage directory exists."""
         if not os.path.exists(self.storage_path):
             os.makedirs(self.storage_path)
+        if self.per_group_files and not os.path.exists(self.groups_dir):
+            os.makedirs(self.groups_dir)
+    
+    @property
+    def _groups_cache(self) -> Dict[str, SymbolGroup]:
+        """Groups keyed by ID, loaded from storage on first access."""
+        if not self._loaded:
+            self._loaded = True
+            self._load_all_groups()
+        return self._groups
+    
+    @_groups_cache.setter
+    def _groups_cache(self, groups: Dict[str, SymbolGroup]) -> None:
+        self._groups = groups
+    
+    def _group_file(self, group_id: str) -> str:
+        """Path of the file holding a single group in per-group mode."""
+        return os.path.join(self.groups_dir, quote(group_id, safe='') + ".json")
     
     def _load_all_groups(self) -> None:
         """Load all groups from storage."""
-        if os.path.exists(self.groups_file):
-            try:
-                with open(self.groups_file, 'r') as f:
-                    data = json.load(f)
-                    for group_data in data.get('groups', []):
-                        group = SymbolGroup.from_dict(group_data)
-                        self._groups_cache[group.group_id] = group
-            except Exception as e:
-                print(f"Error loading groups: {str(e)}")
-                self._groups_cache = {}
+        if self.per_group_files and os.path.exists(self.index_file):
+            self._load_group_files()
+            return
+        
+        groups_file = self.groups_file
+        if not os.path.exists(groups_file):
+            # An uncompressed groups.json from before compression was turned on
+            groups_file = os.path.join(self.storage_path, "groups.json")
+            if not os.path.exists(groups_file):
+                return
+        
+        try:
+            data = _read_json(groups_file)
+            for group_data in data.get('groups', []):
+                group = SymbolGroup.from_dict(group_data)
+                self._groups_cache[group.group_id] = group
+        except Exception:
+            logger.exception("Error loading groups")
+            self._groups_cache = {}
+            return
+        
+        if self.per_group_files or groups_file != self.groups_file:
+            # Nothing is in the configured layout yet: write every group there
+            self._legacy_file = groups_file
+            self._dirty_groups.update(self._groups_cache)
+            self._dirty = bool(self._groups_cache)
+    
+    def _load_group_files(self) -> None:
+        """Load groups stored one per file, in the order recorded in the index."""
+        try:
+            group_ids = _read_json(self.index_file).get('group_ids', [])
+            # Keep groups already read by get_group() so callers holding them stay current
+            loaded = self._groups
+            groups = {}
+            for group_id in group_ids:
+                group = loaded.get(group_id)
+                if group is None:
+                    group = self._read_group_file(group_id)
+                groups[group.group_id] = group
+            self._groups_cache = groups
+            self._stored_group_ids = list(groups)
+        except Exception:
+            logger.exception("Error loading groups")
+            self._groups_cache = {}
+    
+    def _read_group_file(self, group_id: str) -> SymbolGroup:
+        """Read one group from its file in per-group mode."""
+        with open(self._group_file(group_id), 'rb') as f:
+            payload = f.read()
+        group = SymbolGroup.from_dict(_json_loads(payload))
+        self._group_file_payloads[group.group_id] = payload
+        return group
     
-    def _save_all_groups(self) -> bool:
+    def _save_group(self, group_id: str, force: bool = False) -> bool:
+        """Mark one group as changed and write it unless the write is deferred."""
+        self._dirty_groups.add(group_id)
+        if self._recent_ids is not None:
+            # Move the group to the most recently updated end
+            self._recent_ids.pop(group_id, None)
+            self._recent_ids[group_id] = None
+        return self._schedule_flush(force)
+    
+    def _save_all_groups(self, force: bool = False) -> bool:
+        """Mark every group as changed and write them unless the write is deferred.
+        
+        Use this after changing groups directly rather than through the manager.
+        """
+        self._dirty_groups.update(self._groups_cache)
+        self._recent_ids = None
+        return self._schedule_flush(force)
+    
+    def _schedule_flush(self, force: bool) -> bool:
+        """Write pending changes now unless a batch or the flush interval defers them."""
+        self._dirty = True
+        if not force and (self._batch_depth or
+                          time.monotonic() - self._last_flush < self.flush_interval):
+            return True
+        return self._flush_now()
+    
+    def _flush_now(self) -> bool:
         """Save all groups to storage."""
         try:
-            data = {
-                'groups': [group.to_dict() for group in self._groups_cache.values()],
-                'last_updated': datetime.now().isoformat(),
+            if self.per_group_files:
+                self._flush_group_files()
+            else:
+                data = {
+                    'groups': [group.to_dict() for group in self._groups_cache.values()],
+                    'last_updated': _now_iso(),
+                    'version': '1.0'
+                }
+                
+                _write_json(self.groups_file, data)
+            self._dirty = False
+            self._dirty_groups.clear()
+            self._last_flush = time.monotonic()
+        except Exception:
+            logger.exception("Error saving groups")
+            return False
+        
+        if self._legacy_file is not None:
+            self._retire_legacy_file()
+        return True
+    
+    def _retire_legacy_file(self) -> None:
+        """Rename the migrated old-layout groups file to .bak so it cannot be read as current."""
+        try:
+            os.replace(self._legacy_file, self._legacy_file + ".bak")
+            self._legacy_file = None
+        except OSError:
+            logger.warning("Could not rename migrated groups file %s", self._legacy_file, exc_info=True)
+    
+    def _flush_group_files(self) -> None:
+        """Write changed groups to their own files and keep the index in step.
+        
+        Every group is serialized, so changes made directly to a group are
+        written too, but only files whose contents differ are rewritten.
+        """
+        payloads = self._group_file_payloads
+        for group_id, group in self._groups_cache.items():
+            path = self._group_file(group_id)
+            payload = _encode_json(path, group.to_dict())
+            if payloads.get(group_id) != payload:
+                _write_payload(path, payload)
+                payloads[group_id] = payload
+        
+        group_ids = list(self._groups_cache)
+        if group_ids != self._stored_group_ids:
+            # Rewrite the index before removing files so it never names a missing group
+            _write_json(self.index_file, {
+                'group_ids': group_ids,
+                'last_updated': _now_iso(),
                 'version': '1.0'
-            }
-            
-            with open(self.groups_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            })
+            for group_id in set(self._stored_group_ids).difference(group_ids):
+                path = self._group_file(group_id)
+                if os.path.exists(path):
+                    os.remove(path)
+                payloads.pop(group_id, None)
+            self._stored_group_ids = group_ids
+    
+    def flush(self) -> bool:
+        """Write any deferred changes to storage."""
+        if not self._dirty:
             return True
-        except Exception as e:
-            print(f"Error saving groups: {str(e)}")
-            return False
+        return self._flush_now()
+    
+    @contextmanager
+    def batch_updates(self):
+        """Defer all saves inside the block and write once when it exits.
+        
+        Saves inside the block return True once the change is queued; call
+        flush() afterwards to learn whether the write itself succeeded.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and not self.flush():
+                logger.error("Changes made in batch_updates() were not written to %s", self.storage_path)
     
     def create_group(self, 
                     name: str, 
@@ -788,7 +1122,7 @@ class SymbolGroupManager:
         if group_id in self._groups_cache:
             raise ValueError(f"Group with ID '{group_id}' already exists")
         
-        now = datetime.now().isoformat()
+        now = _now_iso()
         group = SymbolGroup(
             group_id=group_id,
             name=name,
@@ -799,26 +1133,43 @@ class SymbolGroupManager:
         )
         
         self._groups_cache[group_id] = group
-        self._save_all_groups()
+        self._save_group(group_id)
         return group
     
     def save_group(self, group: SymbolGroup) -> bool:
         """Save an existing group to storage."""
         try:
-            group.updated_at = datetime.now().isoformat()
+            group.updated_at = _now_iso()
             self._groups_cache[group.group_id] = group
-            return self._save_all_groups()
-        except Exception as e:
-            print(f"Error saving group {group.group_id}: {str(e)}")
+            return self._save_group(group.group_id)
+        except Exception:
+            logger.exception("Error saving group %s", group.group_id)
             return False
     
     def get_group(self, group_id: str) -> Optional[SymbolGroup]:
         """Get a group by ID."""
+        if not self._loaded and self.per_group_files and os.path.exists(self.index_file):
+            # Read just the requested group rather than loading every group
+            group = self._groups.get(group_id)
+            if group is None and os.path.exists(self._group_file(group_id)):
+                try:
+                    group = self._groups[group_id] = self._read_group_file(group_id)
+                except Exception:
+                    logger.exception("Error loading group %s", group_id)
+            return group
         return self._groups_cache.get(group_id)
     
-    def list_groups(self, enabled_only: bool = False) -> List[SymbolGroup]:
-        """List all groups."""
-        groups = list(self._groups_cache.values())
+    def list_groups(self, enabled_only: bool = False, recent_first: bool = False) -> List[SymbolGroup]:
+        """List all groups, in storage order or most recently updated first."""
+        if recent_first:
+            if self._recent_ids is None:
+                # Sort once; saves through the manager keep the order current after that
+                ordered = sorted(self._groups_cache.values(), key=lambda g: g.updated_at)
+                self._recent_ids = dict.fromkeys(g.group_id for g in ordered)
+            cache = self._groups_cache
+            groups = [cache[gid] for gid in reversed(self._recent_ids) if gid in cache]
+        else:
+            groups = list(self._groups_cache.values())
         if enabled_only:
             groups = [g for g in groups if g.enabled]
         return groups
@@ -829,19 +1180,28 @@ class SymbolGroupManager:
         if not group:
             return False
         
+        changed = False
         for key, value in kwargs.items():
-            if hasattr(group, key):
+            if hasattr(group, key) and not _same_scalar(getattr(group, key), value):
                 setattr(group, key, value)
+                changed = True
+        
+        # Nothing differs from what is stored: keep updated_at and skip the write
+        if not changed:
+            return True
         
-        group.updated_at = datetime.now().isoformat()
-        self._save_all_groups()
+        group.updated_at = _now_iso()
+        self._save_group(group_id)
         return True
     
     def delete_group(self, group_id: str) -> bool:
         """Delete a group."""
         if group_id in self._groups_cache:
             del self._groups_cache[group_id]
-            self._save_all_groups()
+            self._dirty_groups.discard(group_id)
+            if self._recent_ids is not None:
+                self._recent_ids.pop(group_id, None)
+            self._schedule_flush(False)
             return True
         return False
     
@@ -869,7 +1229,19 @@ class SymbolGroupManager:
         )
         
         group.add_symbol(symbol_key, config)
-        self._save_all_groups()
+        self._save_group(group_id)
+        return True
+    
+    def add_symbols_to_group(self, group_id: str,
+                             symbols: Iterable[Tuple[str, SymbolConfig]]) -> bool:
+        """Add several (symbol_key, config) pairs to a group and save once."""
+        group = self._groups_cache.get(group_id)
+        if not group:
+            return False
+        
+        for symbol_key, config in symbols:
+            group.add_symbol(symbol_key, config)
+        self._save_group(group_id)
         return True
     
     def configure_symbol_indicators(self, group_id: str, symbol_key: str, 
@@ -881,7 +1253,7 @@ class SymbolGroupManager:
         
         result = group.update_symbol_indicator_settings(symbol_key, indicator_settings)
         if result:
-            self._save_all_groups()
+            self._save_group(group_id)
         return result
     
     def configure_symbol_periodic_alerts(self, group_id: str, symbol_key: str,
@@ -893,7 +1265,7 @@ class SymbolGroupManager:
         
         result = group.update_symbol_periodic_alerts(symbol_key, alert_config)
         if result:
-            self._save_all_groups()
+            self._save_group(group_id)
         return result
     
     def configure_symbol_scheduler_settings(self, group_id: str, symbol_key: str,
@@ -905,7 +1277,7 @@ class SymbolGroupManager:
         
         result = group.update_symbol_scheduler_settings(symbol_key, scheduler_settings)
         if result:
-            self._save_all_groups()
+            self._save_group(group_id)
         return result
     
     def setup_first_time_alerts(self, group_id: str, symbol_key: str,
@@ -917,7 +1289,7 @@ class SymbolGroupManager:
         
         result = group.set_first_time_periodic_alerts_for_symbol(symbol_key, interval, conditions)
         if result:
-            self._save_all_groups()
+            self._save_group(group_id)
         return result
     
     def configure_group_scheduler(self, group_id: str, enabled: bool,
@@ -933,11 +1305,12 @@ class SymbolGroupManager:
         else:
             group.disable_group_scheduler()
         
-        self._save_all_groups()
+        self._save_group(group_id)
         return True
     
     def get_groups_with_alerts(self) -> List[SymbolGroup]:
         """Get all groups that have symbols with periodic alerts enabled."""
+        # Scanned on each call so edits made directly to groups are seen
         groups_with_alerts = []
         for group in self._groups_cache.values():
             if group.enabled and group.get_symbols_with_alerts_enabled():
@@ -960,26 +1333,25 @@ class SymbolGroupManager:
         
         result = group.apply_group_settings_to_symbol(symbol_key, override_existing)
         if result:
-            self._save_all_groups()
+            self._save_group(group_id)
         return result
     
     def get_analysis_overview(self) -> Dict[str, Any]:
         """Get a comprehensive overview of all groups and their analysis configuration."""
         groups = list(self._groups_cache.values())
         
-        total_symbols = sum(len(group.symbols) for group in groups)
-        enabled_symbols = sum(len(group.get_enabled_symbols()) for group in groups)
-        alert_symbols = sum(len(group.get_symbols_with_alerts_enabled()) for group in groups)
-        scheduler_groups = len(self.get_groups_with_scheduler())
+        # One pass over each group's symbols feeds both the totals and the overview
+        summaries = [group.get_analysis_summary() for group in groups]
+        enabled_summaries = [s for g, s in zip(groups, summaries) if g.enabled]
         
         return {
             "total_groups": len(groups),
-            "enabled_groups": len([g for g in groups if g.enabled]),
-            "total_symbols": total_symbols,
-            "enabled_symbols": enabled_symbols,
-            "alert_enabled_symbols": alert_symbols,
-            "scheduler_enabled_groups": scheduler_groups,
-            "groups_overview": [group.get_analysis_summary() for group in groups if group.enabled]
+            "enabled_groups": len(enabled_summaries),
+            "total_symbols": sum(s["total_symbols"] for s in summaries),
+            "enabled_symbols": sum(s["enabled_symbols"] for s in summaries),
+            "alert_enabled_symbols": sum(s["alert_enabled_symbols"] for s in summaries),
+            "scheduler_enabled_groups": sum(1 for s in enabled_summaries if s["scheduler_enabled"]),
+            "groups_overview": enabled_summaries
         }
     
     def remove_symbol_from_group(self, group_id: str, symbol_key: str) -> bool:
@@ -990,7 +1362,7 @@ class SymbolGroupManager:
         
         success = group.remove_symbol(symbol_key)
         if success:
-            self._save_all_groups()
+            self._save_group(group_id)
         return success
     
     def update_symbol_in_group(self, 
@@ -1003,12 +1375,17 @@ class SymbolGroupManager:
             return False
         
         config = group.symbols[symbol_key]
+        changed = False
         for key, value in kwargs.items():
-            if hasattr(config, key):
+            if hasattr(config, key) and not _same_scalar(getattr(config, key), value):
                 setattr(config, key, value)
+                changed = True
         
-        group.updated_at = datetime.now().isoformat()
-        self._save_all_groups()
+        if not changed:
+            return True
+        
+        group.updated_at = _now_iso()
+        self._save_group(group_id)
         return True
     
     def export_group(self, group_id: str, filename: str = None) -> str:
@@ -1022,20 +1399,17 @@ class SymbolGroupManager:
             filename = f"group_{group_id}_{timestamp}.json"
         
         filepath = os.path.join(self.storage_path, filename)
-        with open(filepath, 'w') as f:
-            json.dump(group.to_dict(), f, indent=2)
+        _write_json(filepath, group.to_dict())
         
         return filepath
     
     def import_group(self, filepath: str, new_group_id: str = None) -> SymbolGroup:
         """Import a group from a JSON file."""
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        data = _read_json(filepath)
         
         if new_group_id:
             data['group_id'] = new_group_id
-            data['created_at'] = datetime.now().isoformat()
-            data['updated_at'] = datetime.now().isoformat()
+            data['created_at'] = data['updated_at'] = _now_iso()
         
         group = SymbolGroup.from_dict(data)
         
@@ -1043,7 +1417,7 @@ class SymbolGroupManager:
             raise ValueError(f"Group with ID '{group.group_id}' already exists")
         
         self._groups_cache[group.group_id] = group
-        self._save_all_groups()
+        self._save_group(group.group_id)
         return group
     
     def get_group_summary(self, group_id: str) -> Dict[str, Any]:
@@ -1053,14 +1427,10 @@ class SymbolGroupManager:
             return {}
         
         enabled_symbols = group.get_enabled_symbols()
-        asset_types = {}
-        timeframes = {}
-        data_sources = {}
-        
-        for config in enabled_symbols.values():
-            asset_types[config.asset_type] = asset_types.get(config.asset_type, 0) + 1
-            timeframes[config.timeframe] = timeframes.get(config.timeframe, 0) + 1
-            data_sources[config.data_source] = data_sources.get(config.data_source, 0) + 1
+        configs = enabled_symbols.values()
+        asset_types = dict(Counter(config.asset_type for config in configs))
+        timeframes = dict(Counter(config.timeframe for config in configs))
+        data_sources = dict(Counter(config.data_source for config in configs))
         
         return {
             'group_id': group.group_id,
@@ -1080,72 +1450,81 @@ class SymbolGroupManager:
 class GroupTemplates:
     """Predefined symbol group templates."""
     
-    @staticmethod
-    def create_forex_major_pairs() -> Dict[str, SymbolConfig]:
+    # Template name -> (symbol_key, symbol, asset_type, timeframe, period) rows
+    _TEMPLATES = {
+        'forex_major_pairs': (
+            ('eurusd', 'eurusd', 'forex', '1h', '7d'),
+            ('gbpusd', 'gbpusd', 'forex', '1h', '7d'),
+            ('usdjpy', 'usdjpy', 'forex', '1h', '7d'),
+            ('usdchf', 'usdchf', 'forex', '1h', '7d'),
+            ('audusd', 'audusd', 'forex', '1h', '7d'),
+            ('usdcad', 'usdcad', 'forex', '1h', '7d'),
+            ('nzdusd', 'nzdusd', 'forex', '1h', '7d'),
+        ),
+        'tech_stocks': (
+            ('aapl', 'AAPL', 'stocks', '30m', '5d'),
+            ('msft', 'MSFT', 'stocks', '30m', '5d'),
+            ('googl', 'GOOGL', 'stocks', '30m', '5d'),
+            ('amzn', 'AMZN', 'stocks', '30m', '5d'),
+            ('tsla', 'TSLA', 'stocks', '30m', '5d'),
+            ('meta', 'META', 'stocks', '30m', '5d'),
+            ('nvda', 'NVDA', 'stocks', '30m', '5d'),
+        ),
+        'crypto_portfolio': (
+            ('btc', 'btc', 'crypto', '15m', '3d'),
+            ('eth', 'eth', 'crypto', '15m', '3d'),
+            ('bnb', 'bnb', 'crypto', '15m', '3d'),
+            ('sol', 'sol', 'crypto', '15m', '3d'),
+            ('ada', 'ada', 'crypto', '15m', '3d'),
+            ('doge', 'doge', 'crypto', '15m', '3d'),
+        ),
+        'indices_portfolio': (
+            ('us30', 'us30', 'indices', '30m', '7d'),
+            ('sp500', 'sp500', 'indices', '30m', '7d'),
+            ('nas100', 'nas100', 'indices', '30m', '7d'),
+            ('dax', 'dax', 'indices', '30m', '7d'),
+            ('ftse100', 'ftse100', 'indices', '30m', '7d'),
+            ('nikkei', 'nikkei', 'indices', '30m', '7d'),
+        ),
+        'mixed_portfolio': (
+            ('eurusd', 'eurusd', 'forex', '1h', '7d'),
+            ('aapl', 'AAPL', 'stocks', '30m', '5d'),
+            ('btc', 'btc', 'crypto', '15m', '3d'),
+            ('us30', 'us30', 'indices', '30m', '7d'),
+            ('gold', 'GC=F', 'commodities', '1h', '7d'),
+            ('oil', 'CL=F', 'commodities', '1h', '7d'),
+        ),
+    }
+    
+    @classmethod
+    def get(cls, name: str) -> Dict[str, SymbolConfig]:
+        """Build the symbol configuration for a named template."""
+        return {key: SymbolConfig(*row) for key, *row in cls._TEMPLATES[name]}
+    
+    @classmethod
+    def create_forex_major_pairs(cls) -> Dict[str, SymbolConfig]:
         """Create major forex pairs configuration."""
-        pairs = {
-            'eurusd': SymbolConfig('eurusd', 'forex', '1h', '7d'),
-            'gbpusd': SymbolConfig('gbpusd', 'forex', '1h', '7d'),
-            'usdjpy': SymbolConfig('usdjpy', 'forex', '1h', '7d'),
-            'usdchf': SymbolConfig('usdchf', 'forex', '1h', '7d'),
-            'audusd': SymbolConfig('audusd', 'forex', '1h', '7d'),
-            'usdcad': SymbolConfig('usdcad', 'forex', '1h', '7d'),
-            'nzdusd': SymbolConfig('nzdusd', 'forex', '1h', '7d')
-        }
-        return pairs
+        return cls.get('forex_major_pairs')
     
-    @staticmethod
-    def create_tech_stocks() -> Dict[str, SymbolConfig]:
+    @classmethod
+    def create_tech_stocks(cls) -> Dict[str, SymbolConfig]:
         """Create tech stocks configuration."""
-        stocks = {
-            'aapl': SymbolConfig('AAPL', 'stocks', '30m', '5d'),
-            'msft': SymbolConfig('MSFT', 'stocks', '30m', '5d'),
-            'googl': SymbolConfig('GOOGL', 'stocks', '30m', '5d'),
-            'amzn': SymbolConfig('AMZN', 'stocks', '30m', '5d'),
-            'tsla': SymbolConfig('TSLA', 'stocks', '30m', '5d'),
-            'meta': SymbolConfig('META', 'stocks', '30m', '5d'),
-            'nvda': SymbolConfig('NVDA', 'stocks', '30m', '5d')
-        }
-        return stocks
+        return cls.get('tech_stocks')
     
-    @staticmethod
-    def create_crypto_portfolio() -> Dict[str, SymbolConfig]:
+    @classmethod
+    def create_crypto_portfolio(cls) -> Dict[str, SymbolConfig]:
         """Create crypto portfolio configuration."""
-        cryptos = {
-            'btc': SymbolConfig('btc', 'crypto', '15m', '3d'),
-            'eth': SymbolConfig('eth', 'crypto', '15m', '3d'),
-            'bnb': SymbolConfig('bnb', 'crypto', '15m', '3d'),
-            'sol': SymbolConfig('sol', 'crypto', '15m', '3d'),
-            'ada': SymbolConfig('ada', 'crypto', '15m', '3d'),
-            'doge': SymbolConfig('doge', 'crypto', '15m', '3d')
-        }
-        return cryptos
+        return cls.get('crypto_portfolio')
     
-    @staticmethod
-    def create_indices_portfolio() -> Dict[str, SymbolConfig]:
+    @classmethod
+    def create_indices_portfolio(cls) -> Dict[str, SymbolConfig]:
         """Create indices portfolio configuration."""
-        indices = {
-            'us30': SymbolConfig('us30', 'indices', '30m', '7d'),
-            'sp500': SymbolConfig('sp500', 'indices', '30m', '7d'),
-            'nas100': SymbolConfig('nas100', 'indices', '30m', '7d'),
-            'dax': SymbolConfig('dax', 'indices', '30m', '7d'),
-            'ftse100': SymbolConfig('ftse100', 'indices', '30m', '7d'),
-            'nikkei': SymbolConfig('nikkei', 'indices', '30m', '7d')
-        }
-        return indices
+        return cls.get('indices_portfolio')
     
-    @staticmethod
-    def create_mixed_portfolio() -> Dict[str, SymbolConfig]:
+    @classmethod
+    def create_mixed_portfolio(cls) -> Dict[str, SymbolConfig]:
         """Create a mixed asset portfolio."""
-        mixed = {
-            'eurusd': SymbolConfig('eurusd', 'forex', '1h', '7d'),
-            'aapl': SymbolConfig('AAPL', 'stocks', '30m', '5d'),
-            'btc': SymbolConfig('btc', 'crypto', '15m', '3d'),
-            'us30': SymbolConfig('us30', 'indices', '30m', '7d'),
-            'gold': SymbolConfig('GC=F', 'commodities', '1h', '7d'),
-            'oil': SymbolConfig('CL=F', 'commodities', '1h', '7d')
-        }
-        return mixed
+        return cls.get('mixed_portfolio')
 
 def create_predefined_groups(manager: SymbolGroupManager) -> List[str]:
     """Create predefined symbol groups."""
@@ -1164,27 +1543,23 @@ def create_predefined_groups(manager: SymbolGroupManager) -> List[str]:
          GroupTemplates.create_mixed_portfolio())
     ]
     
-    for group_id, name, description, symbols in templates:
-        try:
-            # Check if group already exists
-            if manager.get_group(group_id):
-                print(f"Group '{group_id}' already exists, skipping...")
-                continue
-            
-            group = manager.create_group(name, description, group_id)
-            
-            # Add symbols to group
-            for symbol_key, config in symbols.items():
-                manager.add_symbol_to_group(
-                    group_id, symbol_key, config.symbol, config.asset_type,
-                    config.timeframe, config.period, config.data_source, config.enabled
-                )
-            
-            groups_created.append(group_id)
-            print(f"Created group: {group_id} with {len(symbols)} symbols")
-            
-        except Exception as e:
-            print(f"Error creating group {group_id}: {str(e)}")
+    # Write the groups file once for all templates instead of once per symbol
+    with manager.batch_updates():
+        for group_id, name, description, symbols in templates:
+            try:
+                # Check if group already exists
+                if manager.get_group(group_id):
+                    print(f"Group '{group_id}' already exists, skipping...")
+                    continue
+                
+                group = manager.create_group(name, description, group_id)
+                manager.add_symbols_to_group(group_id, symbols.items())
+                
+                groups_created.append(group_id)
+                print(f"Created group: {group_id} with {len(symbols)} symbols")
+                
+            except Exception as e:
+                print(f"Error creating group {group_id}: {str(e)}")
     
     return groups_created
 
@@ -7,48 +7,70 @@ and displays the latest indicators and oscillator status.
 
 import sys
 import os
+import io
+import math
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 import pandas as pd
 import numpy as np
 from datetime import datetime
-import yfinance as yf
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from functools import lru_cache
 
 # Import the indicators and oscillators
 from utility.indicators import ADX, Stochastic_Oscillator, RSI, ATRBands, SupertrendIndicator
-from utility.indicators_oscillators import Oscillator, Oscillator_Status
+from utility.indicators_oscillators import Oscillator, Oscillator_Status, STATUS_BANDS, STATUS_ZERO_LINES
+from utility.yfinance_data_loader import fetch_symbols, COLUMN_MAP
 
-def fetch_us30_data(period='7d', interval='30m'):
-    """Fetch US30 data with specified parameters."""
+def fetch_many(symbols, period='7d', interval='30m'):
+    """
+    Fetch several symbols with a single yf.download call.
+    
+    Returns a dict mapping each symbol to its cleaned OHLCV dataframe; symbols
+    Yahoo returned nothing for map to an empty dataframe.
+    """
+    results = fetch_symbols(symbols, period=period, interval=interval)
+    
+    for symbol, symbol_data in results.items():
+        if symbol_data.empty:
+            continue
+        
+        # Standardize column names
+        symbol_data = symbol_data.set_axis([COLUMN_MAP.get(col, col) for col in symbol_data.columns], axis=1)
+        # One NumPy pass over the values instead of pandas' per-column NA masks,
+        # and no copy when there is nothing to drop
+        missing = np.isnan(symbol_data.to_numpy(dtype=np.float64)).any(axis=1)
+        results[symbol] = symbol_data[~missing] if missing.any() else symbol_data
+    
+    return results
+
+def fetch_us30_data(period='7d', interval='30m', downcast=False):
+    """
+    Fetch US30 data with specified parameters.
+    
+    With downcast=True the OHLC columns are converted to float32 and volume to
+    the smallest integer type that holds it, halving the data the indicators
+    have to stream through. Index-level prices then keep about 7 significant
+    digits, so the last printed decimals can differ from the float64 run.
+    """
     print(f"Fetching US30 data - Period: {period}, Interval: {interval}")
     
     # US30 symbol for yfinance
     symbol = '^DJI'  # Dow Jones Industrial Average
     
     try:
-        data = yf.download(symbol, period=period, interval=interval, progress=False)
+        data = fetch_many([symbol], period=period, interval=interval)[symbol]
         
         if data.empty:
             print("No data retrieved")
             return pd.DataFrame()
         
-        # Clean up the data
-        if isinstance(data.columns, pd.MultiIndex):
-            data.columns = ['_'.join(col).strip() for col in data.columns.values]
-            data.columns = [col[:-1] if col.endswith('_') else col for col in data.columns]
-        
-        # Standardize column names
-        column_mapping = {
-            'Open': 'open',
-            'High': 'high', 
-            'Low': 'low',
-            'Close': 'close',
-            'Volume': 'volume',
-            'Adj Close': 'adj_close'
-        }
-        
-        data.rename(columns=column_mapping, inplace=True)
-        data = data.dropna()
+        if downcast:
+            ohlc = ['open', 'high', 'low', 'close']
+            data[ohlc] = data[ohlc].astype(np.float32)
+            data['volume'] = pd.to_numeric(data['volume'], downcast='integer')
         
         print(f"Successfully fetched {len(data)} data points")
         return data
@@ -61,35 +83,40 @@ def apply_indicators(df):
     """Apply technical indicators to the dataframe."""
     print("Applying technical indicators...")
     
-    result_df = df.copy()
+    # Collect the new columns and attach them in one go instead of copying df first
+    new_columns = {}
+    
+    # The indicators only read df (each works on its own copy) and spend their
+    # time in pandas/NumPy kernels, so they can run side by side
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        adx_future = executor.submit(ADX(adx_period=14).calculate, df)
+        stoch_future = executor.submit(Stochastic_Oscillator(k_period=14, k_smooth=3, d_period=3).calculate, df)
+        rsi_future = executor.submit(RSI(rsi_period=14).calculate, df)
+        atr_future = executor.submit(ATRBands(atr_period=14, atr_multiplier=2.0).calculate, df)
+        supertrend_future = executor.submit(SupertrendIndicator(period=10, multiplier=3.0).calculate, df)
     
     try:
         # Apply ADX
-        adx_indicator = ADX(adx_period=14)
-        result_df['+DI'], result_df['-DI'], result_df['ADX'] = adx_indicator.calculate(result_df)
+        new_columns['+DI'], new_columns['-DI'], new_columns['ADX'] = adx_future.result()
         
         # Apply Stochastic
-        stoch_indicator = Stochastic_Oscillator(k_period=14, k_smooth=3, d_period=3)
-        result_df['%K'], result_df['%D'] = stoch_indicator.calculate(result_df)
+        new_columns['%K'], new_columns['%D'] = stoch_future.result()
         
         # Apply RSI
-        rsi_indicator = RSI(rsi_period=14)
-        result_df['RSI'] = rsi_indicator.calculate(result_df)
+        new_columns['RSI'] = rsi_future.result()
         
         # Apply ATR Bands
-        atr_indicator = ATRBands(atr_period=14, atr_multiplier=2.0)
-        result_df['ATR'], result_df['ATR_Upper'], result_df['ATR_Lower'] = atr_indicator.calculate(result_df)
+        new_columns['ATR'], new_columns['ATR_Upper'], new_columns['ATR_Lower'] = atr_future.result()
         
         # Apply Supertrend
-        supertrend_indicator = SupertrendIndicator(period=10, multiplier=3.0)
-        result_df['Supertrend'], result_df['ST_Direction'] = supertrend_indicator.calculate(result_df)
+        new_columns['Supertrend'], new_columns['ST_Direction'] = supertrend_future.result()
         
         print("Successfully applied main indicators")
         
     except Exception as e:
         print(f"Error applying main indicators: {str(e)}")
     
-    return result_df
+    return df.assign(**new_columns)
 
 def apply_oscillators(df):
     """Apply oscillator indicators and get their status."""
@@ -100,7 +127,10 @@ def apply_oscillators(df):
         oscillator = Oscillator(df)
         
         # Apply oscillators
-        df['RSI_14'] = oscillator.rsi_14()
+        # apply_indicators' RSI(14) uses the same rolling-mean formula as
+        # rsi_14(); Stoch_K and ADX_14 differ from %K and ADX, so they are recomputed
+        rsi_14 = df['RSI'] if 'RSI' in df.columns else oscillator.rsi_14()
+        df['RSI_14'] = rsi_14
         stoch_data = oscillator.stochastic_k_14_3_3()
         df['Stoch_K'] = stoch_data['%K']
         df['Stoch_D'] = stoch_data['%D']
@@ -114,7 +144,7 @@ def apply_oscillators(df):
         df['MACD'] = macd_data['MACD']
         df['MACD_Signal'] = macd_data['Signal_Line']
         
-        df['Stoch_RSI'] = oscillator.stochastic_rsi()
+        df['Stoch_RSI'] = oscillator.stochastic_rsi(rsi_14)
         df['Williams_R'] = oscillator.williams_percent_r()
         
         bull_bear = oscillator.bull_bear_power()
@@ -130,6 +160,50 @@ def apply_oscillators(df):
     
     return df
 
+# (column, Oscillator_Status indicator name) pairs rated by get_oscillator_status
+_OSCILLATORS_TO_CHECK = (
+    ('RSI_14', 'RSI_14'),
+    ('Stoch_K', '%K'),
+    ('CCI_20', 'CCI_20'),
+    ('Stoch_RSI', 'Stoch_RSI'),
+    ('Williams_R', '%R'),
+    ('Bull_Power', 'Bull_Power'),
+    ('Bear_Power', 'Bear_Power'),
+    ('Ultimate_Oscillator', 'UO'),
+    ('MACD', 'MACD')
+)
+_OSCILLATOR_STATUS_NAMES = dict(_OSCILLATORS_TO_CHECK)
+
+@lru_cache(maxsize=None)
+def _status_rule_arrays(names):
+    """Oscillator_Status band bounds and zero-line tolerances for a tuple of indicator names, as arrays."""
+    low = np.array([STATUS_BANDS.get(name, (np.nan, np.nan))[0] for name in names])
+    high = np.array([STATUS_BANDS.get(name, (np.nan, np.nan))[1] for name in names])
+    tolerance = np.array([STATUS_ZERO_LINES.get(name, (np.nan, False))[0] for name in names])
+    inclusive = np.array([STATUS_ZERO_LINES.get(name, (np.nan, False))[1] for name in names])
+    return low, high, tolerance, inclusive
+
+# The full oscillator set is what every normal run rates, so build its arrays up front
+_status_rule_arrays(tuple(_OSCILLATOR_STATUS_NAMES.values()))
+
+def _oscillator_statuses(names, values):
+    """Rate each value as Buy/Sell/Neutral, matching Oscillator_Status.get_status."""
+    values = np.asarray(values, dtype=np.float64)
+    low, high, tolerance, inclusive = _status_rule_arrays(tuple(names))
+    
+    is_band = ~np.isnan(low)
+    is_zero_line = ~np.isnan(tolerance)
+    magnitude = np.abs(values)
+    near_zero = np.where(inclusive, magnitude <= tolerance, magnitude < tolerance)
+    
+    statuses = np.select(
+        [is_band & (values > high), is_band & (values < low),
+         is_zero_line & ~near_zero & (values > 0), is_zero_line & ~near_zero],
+        ['Sell', 'Buy', 'Buy', 'Sell'],
+        default='Neutral'
+    )
+    return statuses.tolist()
+
 def get_oscillator_status(df):
     """Get the current status of all oscillators."""
     print("\nGetting oscillator status for latest data point...")
@@ -138,88 +212,84 @@ def get_oscillator_status(df):
         print("No data available for status analysis")
         return {}
     
-    latest_data = df.iloc[-1]
-    prev_data = df.iloc[-2] if len(df) > 1 else latest_data
-    
     status_results = {}
     
-    # Define oscillators to check with their status
-    oscillators_to_check = [
-        ('RSI_14', 'RSI_14'),
-        ('Stoch_K', '%K'),
-        ('CCI_20', 'CCI_20'),
-        ('Stoch_RSI', 'Stoch_RSI'),
-        ('Williams_R', '%R'),
-        ('Bull_Power', 'Bull_Power'),
-        ('Bear_Power', 'Bear_Power'),
-        ('Ultimate_Oscillator', 'UO'),
-        ('MACD', 'MACD')
-    ]
-    
-    for col_name, indicator_name in oscillators_to_check:
-        if col_name in df.columns:
-            try:
-                current_value = latest_data[col_name]
-                prev_value = prev_data[col_name] if col_name in prev_data else None
-                
-                status = Oscillator_Status.get_status(current_value, indicator_name, prev_value)
-                status_results[col_name] = {
-                    'value': current_value,
-                    'status': status,
-                    'previous_value': prev_value
+    columns = [col for col, _ in _OSCILLATORS_TO_CHECK if col in df.columns]
+    if columns:
+        try:
+            # Last two rows of every oscillator at once, rated in one NumPy pass
+            names = [_OSCILLATOR_STATUS_NAMES[col] for col in columns]
+            values = df[columns].to_numpy(dtype=np.float64)[-2:]
+            current_values = values[-1]
+            prev_values = values[0]
+            statuses = _oscillator_statuses(names, current_values)
+            
+            status_results = {
+                col: {
+                    'value': current_values[i],
+                    'status': statuses[i],
+                    'previous_value': prev_values[i]
                 }
-            except Exception as e:
-                print(f"Error getting status for {col_name}: {str(e)}")
+                for i, col in enumerate(columns)
+            }
+        except Exception as e:
+            print(f"Error getting oscillator status: {str(e)}")
     
     # Special handling for DMI
     if 'DMI' in df.columns and len(df) >= 2:
         try:
-            dmi_data = df[['DMI']].tail(2)
-            dmi_status = Oscillator_Status.dmi_status(dmi_data)
+            dmi = df['DMI']
+            dmi_value, prev_dmi_value = dmi.iat[-1], dmi.iat[-2]
             status_results['DMI'] = {
-                'value': latest_data['DMI'],
-                'status': dmi_status,
-                'previous_value': prev_data['DMI']
+                'value': dmi_value,
+                'status': Oscillator_Status.dmi_status_scalar(dmi_value, prev_dmi_value),
+                'previous_value': prev_dmi_value
             }
         except Exception as e:
             print(f"Error getting DMI status: {str(e)}")
     
     return status_results
 
-def run_us30_analysis():
-    """Run complete US30 analysis."""
-    print("="*60)
-    print("US30 (DOW JONES) ANALYSIS - 30 MINUTE TIMEFRAME")
-    print("="*60)
-    
-    # Step 1: Fetch data
-    data = fetch_us30_data(period='7d', interval='30m')
-    
-    if data.empty:
-        print("Failed to fetch data. Exiting.")
-        return
-    
-    # Step 2: Apply indicators
-    data_with_indicators = apply_indicators(data)
-    
-    # Step 3: Apply oscillators
-    data_with_oscillators = apply_oscillators(data_with_indicators)
-    
-    # Step 4: Display last 7 close prices
+def _format_values(values):
+    """
+    Format finite numbers to 4 decimals and anything else (N/A, NaN, timestamps) as is.
+    
+    The numbers are formatted together with one np.char.mod call.
+    """
+    formatted = []
+    numeric_positions = []
+    for i, value in enumerate(values):
+        try:
+            if math.isfinite(value):
+                numeric_positions.append(i)
+        except TypeError:
+            pass
+        formatted.append(str(value))
+    
+    if numeric_positions:
+        numbers = np.array([values[i] for i in numeric_positions], dtype=np.float64)
+        for i, text in zip(numeric_positions, np.char.mod('%.4f', numbers).tolist()):
+            formatted[i] = text
+    return formatted
+
+def _print_report(df):
+    """Print the close prices, indicator values, oscillator statuses and summary."""
+    # Display last 7 close prices
     print(f"\n{'='*40}")
     print("LAST 7 CLOSE PRICES")
     print(f"{'='*40}")
     
-    last_7_closes = data_with_oscillators['close'].tail(7)
-    for i, (timestamp, close_price) in enumerate(last_7_closes.items(), 1):
-        print(f"{i}. {timestamp.strftime('%Y-%m-%d %H:%M'): <20} | Close: ${close_price:,.2f}")
+    last_7_closes = df['close'].tail(7)
+    timestamps = last_7_closes.index.strftime('%Y-%m-%d %H:%M')
+    for i, (timestamp, close_price) in enumerate(zip(timestamps, last_7_closes.to_numpy()), 1):
+        print(f"{i}. {timestamp: <20} | Close: ${close_price:,.2f}")
     
-    # Step 5: Display latest indicators data
+    # Display latest indicators data
     print(f"\n{'='*40}")
     print("LATEST INDICATORS DATA")
     print(f"{'='*40}")
     
-    latest_row = data_with_oscillators.iloc[-1]
+    latest_row = df.iloc[-1].to_dict()
     
     # Main indicators
     main_indicators = {
@@ -235,11 +305,8 @@ def run_us30_analysis():
     }
     
     print("Main Indicators:")
-    for indicator, value in main_indicators.items():
-        if isinstance(value, (int, float)) and not pd.isna(value):
-            print(f"  {indicator: <15}: {value:.4f}")
-        else:
-            print(f"  {indicator: <15}: {value}")
+    for indicator, text in zip(main_indicators, _format_values(list(main_indicators.values()))):
+        print(f"  {indicator: <15}: {text}")
     
     # Oscillator indicators
     oscillator_indicators = {
@@ -258,18 +325,15 @@ def run_us30_analysis():
     }
     
     print("\nOscillator Indicators:")
-    for indicator, value in oscillator_indicators.items():
-        if isinstance(value, (int, float)) and not pd.isna(value):
-            print(f"  {indicator: <20}: {value:.4f}")
-        else:
-            print(f"  {indicator: <20}: {value}")
+    for indicator, text in zip(oscillator_indicators, _format_values(list(oscillator_indicators.values()))):
+        print(f"  {indicator: <20}: {text}")
     
-    # Step 6: Get oscillator status
+    # Get oscillator status
     print(f"\n{'='*40}")
     print("OSCILLATOR STATUS ANALYSIS")
     print(f"{'='*40}")
     
-    status_results = get_oscillator_status(data_with_oscillators)
+    status_results = get_oscillator_status(df)
     
     for oscillator, status_data in status_results.items():
         value = status_data['value']
@@ -278,24 +342,29 @@ def run_us30_analysis():
         
         print(f"\n{oscillator}:")
         print(f"  Current Value : {value:.4f}")
-        if isinstance(prev_value, (int, float)) and not pd.isna(prev_value):
+        try:
+            has_prev_value = math.isfinite(prev_value)
+        except TypeError:
+            has_prev_value = False
+        if has_prev_value:
             print(f"  Previous Value: {prev_value:.4f}")
             change = value - prev_value
             change_direction = "↑" if change > 0 else "↓" if change < 0 else "→"
             print(f"  Change        : {change:+.4f} {change_direction}")
         print(f"  Status        : {status}")
     
-    # Step 7: Summary
+    # Summary
     print(f"\n{'='*40}")
     print("SUMMARY")
     print(f"{'='*40}")
     
-    buy_signals = sum(1 for status_data in status_results.values() if status_data['status'] == 'Buy')
-    sell_signals = sum(1 for status_data in status_results.values() if status_data['status'] == 'Sell')
-    neutral_signals = sum(1 for status_data in status_results.values() if status_data['status'] == 'Neutral')
+    status_counts = Counter(status_data['status'] for status_data in status_results.values())
+    buy_signals = status_counts['Buy']
+    sell_signals = status_counts['Sell']
+    neutral_signals = status_counts['Neutral']
     
     print(f"Analysis Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"Data Points Analyzed: {len(data_with_oscillators)}")
+    print(f"Data Points Analyzed: {len(df)}")
     print(f"Latest Close Price: ${latest_row['close']:,.2f}")
     print(f"\nSignal Distribution:")
     print(f"  Buy Signals   : {buy_signals}")
@@ -312,6 +381,33 @@ def run_us30_analysis():
         overall_sentiment = "NEUTRAL"
     
     print(f"\nOverall Sentiment: {overall_sentiment}")
+
+def run_us30_analysis():
+    """Run complete US30 analysis."""
+    print("="*60)
+    print("US30 (DOW JONES) ANALYSIS - 30 MINUTE TIMEFRAME")
+    print("="*60)
+    
+    # Step 1: Fetch data
+    data = fetch_us30_data(period='7d', interval='30m')
+    
+    if data.empty:
+        print("Failed to fetch data. Exiting.")
+        return
+    
+    # Step 2: Apply indicators
+    data_with_indicators = apply_indicators(data)
+    
+    # Step 3: Apply oscillators
+    data_with_oscillators = apply_oscillators(data_with_indicators)
+    
+    # Steps 4-7: build the report in memory and write it out in one go
+    report = io.StringIO()
+    try:
+        with redirect_stdout(report):
+            _print_report(data_with_oscillators)
+    finally:
+        sys.stdout.write(report.getvalue())
     
     return data_with_oscillators
 
@@ -10,9 +10,10 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 import pandas as pd
 import numpy as np
-import yfinance as yf
 from datetime import datetime
 
+from yfinance_data_loader import download_cached, COLUMN_MAP
+
 def debug_us30_data():
     """Debug US30 data fetching to understand column structure."""
     print("="*60)
@@ -25,7 +26,7 @@ def debug_us30_data():
     
     try:
         # Fetch data with verbose output
-        data = yf.download(symbol, period='7d', interval='30m', progress=True)
+        data = download_cached(symbol, period='7d', interval='30m', progress=True)
         
         print(f"\nRaw data shape: {data.shape}")
         print(f"Raw columns: {list(data.columns)}")
@@ -45,8 +46,7 @@ def debug_us30_data():
         # Handle MultiIndex columns if they exist
         if isinstance(data.columns, pd.MultiIndex):
             print("MultiIndex columns detected, flattening...")
-            data.columns = ['_'.join(col).strip() for col in data.columns.values]
-            data.columns = [col[:-1] if col.endswith('_') else col for col in data.columns]
+            data.columns = data.columns.map('_'.join).str.strip().str.removesuffix('_')
             print(f"After flattening: {list(data.columns)}")
         
         # Remove symbol suffix from column names if present
@@ -56,22 +56,14 @@ def debug_us30_data():
             print(f"After removing symbol suffix: {list(data.columns)}")
         
         # Standardize column names
-        column_mapping = {
-            'Open': 'open',
-            'High': 'high', 
-            'Low': 'low',
-            'Close': 'close',
-            'Volume': 'volume',
-            'Adj Close': 'adj_close'
-        }
-        
-        print(f"Applying column mapping: {column_mapping}")
-        data.rename(columns=column_mapping, inplace=True)
+        print(f"Applying column mapping: {COLUMN_MAP}")
+        data.columns = [COLUMN_MAP.get(col, col) for col in data.columns]
         print(f"After renaming: {list(data.columns)}")
         
         # Remove NaN rows
         original_length = len(data)
-        data = data.dropna()
+        # One NumPy pass over the values instead of pandas' per-column NA masks
+        data = data[~np.isnan(data.to_numpy(dtype=np.float64)).any(axis=1)]
         if len(data) != original_length:
             print(f"Removed {original_length - len(data)} NaN rows")
         
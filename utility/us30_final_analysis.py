@@ -11,42 +11,118 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 import pandas as pd
 import numpy as np
-import yfinance as yf
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 # Import indicators and oscillators
 from indicators_oscillators import Oscillator, Oscillator_Status
+from yfinance_data_loader import fetch_symbols, COLUMN_MAP
+
+# Oscillator methods run by the comprehensive analysis
+_OSCILLATOR_METHODS = (
+    'rsi_14', 'stochastic_k_14_3_3', 'cci_20', 'adx_14', 'calculate_dmi',
+    'awesome_oscillator', 'momentum_10', 'macd_12_26', 'stochastic_rsi',
+    'williams_percent_r', 'bull_bear_power', 'ultimate_oscillator'
+)
+
+# hash of the analysed frame -> indicators, oldest first
+_INDICATOR_CACHE = {}
+_INDICATOR_CACHE_SIZE = 4
+
+def _run_oscillator_method(data, method):
+    """Run one Oscillator method on its own shallow copy of data."""
+    return getattr(Oscillator(data.copy(deep=False)), method)()
+
+def _compute_indicators(data):
+    """Run all oscillators on data and return {column: Series}."""
+    # The methods are independent, so run them side by side; each gets its
+    # own Oscillator on a shallow copy since they write working columns
+    with ThreadPoolExecutor(max_workers=min(len(_OSCILLATOR_METHODS), os.cpu_count() or 1)) as executor:
+        futures = {
+            method: executor.submit(_run_oscillator_method, data, method)
+            for method in _OSCILLATOR_METHODS
+        }
+    results = {method: future.result() for method, future in futures.items()}
+    
+    # Collect the result columns
+    indicators = {}
+    
+    # RSI
+    indicators['RSI_14'] = results['rsi_14']
+    
+    # Stochastic
+    stoch_data = results['stochastic_k_14_3_3']
+    indicators['Stoch_K'] = stoch_data['%K']
+    indicators['Stoch_D'] = stoch_data['%D']
+    
+    # CCI
+    indicators['CCI_20'] = results['cci_20']
+    
+    # ADX
+    indicators['ADX_14'] = results['adx_14']
+    
+    # DMI
+    indicators['DMI'] = results['calculate_dmi']
+    
+    # Awesome Oscillator
+    indicators['AO'] = results['awesome_oscillator']
+    
+    # Momentum
+    indicators['Momentum_10'] = results['momentum_10']
+    
+    # MACD
+    macd_data = results['macd_12_26']
+    indicators['MACD'] = macd_data['MACD']
+    indicators['MACD_Signal'] = macd_data['Signal_Line']
+    
+    # Stochastic RSI
+    indicators['Stoch_RSI'] = results['stochastic_rsi']
+    
+    # Williams %R
+    indicators['Williams_R'] = results['williams_percent_r']
+    
+    # Bull/Bear Power
+    bull_bear = results['bull_bear_power']
+    indicators['Bull_Power'] = bull_bear['Bull_Power']
+    indicators['Bear_Power'] = bull_bear['Bear_Power']
+    
+    # Ultimate Oscillator
+    indicators['Ultimate_Oscillator'] = results['ultimate_oscillator']
+    
+    return indicators
+
+def _cached_indicators(data):
+    """
+    _compute_indicators, reusing the result for a frame already analysed.
+    
+    Repeated runs within one bar get the same download back, so the values
+    hash to the same key and the indicators are not recomputed.
+    """
+    key = int(pd.util.hash_pandas_object(data, index=True).sum())
+    if key not in _INDICATOR_CACHE:
+        if len(_INDICATOR_CACHE) >= _INDICATOR_CACHE_SIZE:
+            _INDICATOR_CACHE.pop(next(iter(_INDICATOR_CACHE)))
+        _INDICATOR_CACHE[key] = _compute_indicators(data)
+    return _INDICATOR_CACHE[key]
 
 def fetch_us30_data_fixed(period='7d', interval='30m'):
     """Fetch and properly clean US30 data."""
     symbol = '^DJI'  # Dow Jones Industrial Average
     
     try:
-        # Fetch data
-        data = yf.download(symbol, period=period, interval=interval, progress=False)
+        # Fetch data, reusing the copy saved during the current bar
+        data = fetch_symbols([symbol], period=period, interval=interval)[symbol]
         
         if data.empty:
             return pd.DataFrame()
         
-        # Handle MultiIndex columns properly
-        if isinstance(data.columns, pd.MultiIndex):
-            # Flatten MultiIndex columns
-            data.columns = ['_'.join(col).strip() for col in data.columns.values]
-            # Remove trailing underscores and symbol suffixes
-            data.columns = [col.replace(f'_{symbol}', '').rstrip('_') for col in data.columns]
-        
         # Standardize column names
-        column_mapping = {
-            'Open': 'open',
-            'High': 'high', 
-            'Low': 'low',
-            'Close': 'close',
-            'Volume': 'volume',
-            'Adj Close': 'adj_close'
-        }
+        data.rename(columns=COLUMN_MAP, inplace=True)
         
-        data.rename(columns=column_mapping, inplace=True)
-        data = data.dropna()
+        # Only copy the frame when there actually are NaN rows to drop
+        missing = np.isnan(data.to_numpy(dtype=np.float64)).any(axis=1)
+        if missing.any():
+            data = data[~missing]
         
         return data
         
@@ -54,6 +130,16 @@ def fetch_us30_data_fixed(period='7d', interval='30m'):
         print(f"Error fetching data: {str(e)}")
         return pd.DataFrame()
 
+def _indicator_lines(indicators):
+    """Report lines for a {name: value} table; missing and NaN values show as N/A."""
+    # Missing values (None) become NaN here, so one isnan mask covers both
+    values = np.array(list(indicators.values()), dtype=np.float64)
+    valid = ~np.isnan(values)
+    return [
+        f"   {indicator:<20}: {value:8.4f}" if is_valid else f"   {indicator:<20}: {'N/A':>8}"
+        for indicator, value, is_valid in zip(indicators, values, valid)
+    ]
+
 def run_comprehensive_us30_analysis():
     """Run comprehensive US30 analysis with all indicators and status."""
     
@@ -79,20 +165,23 @@ def run_comprehensive_us30_analysis():
     print(f"{'='*50}")
     
     last_7_closes = data['close'].tail(7)
-    for i, (timestamp, close_price) in enumerate(last_7_closes.items(), 1):
-        # Format timestamp to show date and time
-        formatted_time = timestamp.strftime('%Y-%m-%d %H:%M UTC')
-        print(f"{i:2d}. {formatted_time} | ${close_price:8,.2f}")
+    # Format all timestamps to show date and time in one call
+    formatted_times = last_7_closes.index.strftime('%Y-%m-%d %H:%M UTC')
+    sys.stdout.write('\n'.join(
+        f"{i:2d}. {formatted_time} | ${close_price:8,.2f}"
+        for i, (formatted_time, close_price) in enumerate(zip(formatted_times, last_7_closes.to_numpy()), 1)
+    ) + '\n')
     
     # Calculate price change for last 7 periods
-    price_changes = last_7_closes.diff().dropna()
-    avg_change = price_changes.mean()
-    total_change = last_7_closes.iloc[-1] - last_7_closes.iloc[0]
+    avg_change = np.diff(last_7_closes.to_numpy()).mean()
+    start_price = float(last_7_closes.iat[0])
+    end_price = float(last_7_closes.iat[-1])
+    total_change = end_price - start_price
     
     print(f"\n📊 Price Movement Summary (Last 7 periods):")
-    print(f"   Starting Price: ${last_7_closes.iloc[0]:8,.2f}")
-    print(f"   Current Price:  ${last_7_closes.iloc[-1]:8,.2f}")
-    print(f"   Total Change:   ${total_change:+8,.2f} ({total_change/last_7_closes.iloc[0]*100:+.2f}%)")
+    print(f"   Starting Price: ${start_price:8,.2f}")
+    print(f"   Current Price:  ${end_price:8,.2f}")
+    print(f"   Total Change:   ${total_change:+8,.2f} ({total_change/start_price*100:+.2f}%)")
     print(f"   Average Change: ${avg_change:+8,.2f}")
     
     # Step 3: Apply oscillators and get comprehensive data
@@ -101,64 +190,10 @@ def run_comprehensive_us30_analysis():
     print(f"{'='*50}")
     
     try:
-        oscillator = Oscillator(data)
-        
-        # Apply all oscillators
-        indicators_applied = []
-        
-        # RSI
-        data['RSI_14'] = oscillator.rsi_14()
-        indicators_applied.append('RSI_14')
-        
-        # Stochastic
-        stoch_data = oscillator.stochastic_k_14_3_3()
-        data['Stoch_K'] = stoch_data['%K']
-        data['Stoch_D'] = stoch_data['%D']
-        indicators_applied.extend(['Stoch_K', 'Stoch_D'])
-        
-        # CCI
-        data['CCI_20'] = oscillator.cci_20()
-        indicators_applied.append('CCI_20')
-        
-        # ADX
-        data['ADX_14'] = oscillator.adx_14()
-        indicators_applied.append('ADX_14')
-        
-        # DMI
-        data['DMI'] = oscillator.calculate_dmi()
-        indicators_applied.append('DMI')
-        
-        # Awesome Oscillator
-        data['AO'] = oscillator.awesome_oscillator()
-        indicators_applied.append('AO')
+        indicators = _cached_indicators(data)
         
-        # Momentum
-        data['Momentum_10'] = oscillator.momentum_10()
-        indicators_applied.append('Momentum_10')
-        
-        # MACD
-        macd_data = oscillator.macd_12_26()
-        data['MACD'] = macd_data['MACD']
-        data['MACD_Signal'] = macd_data['Signal_Line']
-        indicators_applied.extend(['MACD', 'MACD_Signal'])
-        
-        # Stochastic RSI
-        data['Stoch_RSI'] = oscillator.stochastic_rsi()
-        indicators_applied.append('Stoch_RSI')
-        
-        # Williams %R
-        data['Williams_R'] = oscillator.williams_percent_r()
-        indicators_applied.append('Williams_R')
-        
-        # Bull/Bear Power
-        bull_bear = oscillator.bull_bear_power()
-        data['Bull_Power'] = bull_bear['Bull_Power']
-        data['Bear_Power'] = bull_bear['Bear_Power']
-        indicators_applied.extend(['Bull_Power', 'Bear_Power'])
-        
-        # Ultimate Oscillator
-        data['Ultimate_Oscillator'] = oscillator.ultimate_oscillator()
-        indicators_applied.append('Ultimate_Oscillator')
+        data = pd.concat([data, pd.DataFrame(indicators, index=data.index)], axis=1)
+        indicators_applied = list(indicators)
         
         print(f"✅ Applied {len(indicators_applied)} indicators successfully")
         
@@ -171,7 +206,9 @@ def run_comprehensive_us30_analysis():
     print("📊 LATEST INDICATOR VALUES")
     print(f"{'='*50}")
     
-    latest_row = data.iloc[-1]
+    # The last two rows as plain dicts, so every lookup below is a dict lookup
+    last_rows = data.tail(2).to_dict(orient='records')
+    latest_row = last_rows[-1]
     
     # Group indicators by category
     momentum_indicators = {
@@ -199,33 +236,21 @@ def run_comprehensive_us30_analysis():
     }
     
     print("🎯 MOMENTUM INDICATORS:")
-    for indicator, value in momentum_indicators.items():
-        if isinstance(value, (int, float)) and not pd.isna(value):
-            print(f"   {indicator:<20}: {value:8.4f}")
-        else:
-            print(f"   {indicator:<20}: {'N/A':>8}")
+    sys.stdout.write('\n'.join(_indicator_lines(momentum_indicators)) + '\n')
     
     print("\n📈 TREND INDICATORS:")
-    for indicator, value in trend_indicators.items():
-        if isinstance(value, (int, float)) and not pd.isna(value):
-            print(f"   {indicator:<20}: {value:8.4f}")
-        else:
-            print(f"   {indicator:<20}: {'N/A':>8}")
+    sys.stdout.write('\n'.join(_indicator_lines(trend_indicators)) + '\n')
     
     print("\n💪 VOLUME/POWER INDICATORS:")
-    for indicator, value in volume_indicators.items():
-        if isinstance(value, (int, float)) and not pd.isna(value):
-            print(f"   {indicator:<20}: {value:8.4f}")
-        else:
-            print(f"   {indicator:<20}: {'N/A':>8}")
+    sys.stdout.write('\n'.join(_indicator_lines(volume_indicators)) + '\n')
     
     # Step 5: Get oscillator status analysis
     print(f"\n{'='*50}")
     print("🎯 OSCILLATOR STATUS ANALYSIS")
     print(f"{'='*50}")
     
-    latest_data = data.iloc[-1]
-    prev_data = data.iloc[-2] if len(data) > 1 else latest_data
+    latest_data = latest_row
+    prev_data = last_rows[0]
     
     # Define oscillators with their status mappings
     oscillator_configs = [
@@ -241,30 +266,26 @@ def run_comprehensive_us30_analysis():
     ]
     
     status_results = {}
+    status_handlers = Oscillator_Status.HANDLERS
     
-    for col_name, status_key, display_name in oscillator_configs:
-        if col_name in data.columns:
-            try:
-                current_value = latest_data[col_name]
-                prev_value = prev_data[col_name] if col_name in prev_data else None
-                
-                status = Oscillator_Status.get_status(current_value, status_key, prev_value)
-                
-                status_results[display_name] = {
-                    'value': current_value,
-                    'status': status,
-                    'previous_value': prev_value,
-                    'column': col_name
-                }
-                
-            except Exception as e:
-                print(f"❌ Error processing {display_name}: {str(e)}")
+    # Only the oscillators that were computed; every status key has a handler
+    valid_configs = [config for config in oscillator_configs if config[0] in latest_data]
+    
+    for col_name, status_key, display_name in valid_configs:
+        current_value = latest_data[col_name]
+        prev_value = prev_data.get(col_name)
+        
+        status_results[display_name] = {
+            'value': current_value,
+            'status': status_handlers[status_key](current_value, prev_value),
+            'previous_value': prev_value,
+            'column': col_name
+        }
     
     # Special handling for DMI
     if 'DMI' in data.columns and len(data) >= 2:
         try:
-            dmi_data = data[['DMI']].tail(2)
-            dmi_status = Oscillator_Status.dmi_status(dmi_data)
+            dmi_status = Oscillator_Status.dmi_status_scalar(latest_data['DMI'], prev_data['DMI'])
             status_results['Directional Movement Index'] = {
                 'value': latest_data['DMI'],
                 'status': dmi_status,
@@ -300,9 +321,15 @@ def run_comprehensive_us30_analysis():
     print(f"{'='*50}")
     
     # Count signals
-    buy_signals = sum(1 for data in status_results.values() if data['status'] == 'Buy')
-    sell_signals = sum(1 for data in status_results.values() if data['status'] == 'Sell')
-    neutral_signals = sum(1 for data in status_results.values() if data['status'] == 'Neutral')
+    # One pass for both the counts and the indicator names behind each signal
+    signal_names = {'Buy': [], 'Sell': [], 'Neutral': []}
+    for indicator_name, status_data in status_results.items():
+        signal_names.setdefault(status_data['status'], []).append(indicator_name)
+    buy_indicators = signal_names['Buy']
+    sell_indicators = signal_names['Sell']
+    buy_signals = len(buy_indicators)
+    sell_signals = len(sell_indicators)
+    neutral_signals = len(signal_names['Neutral'])
     total_signals = len(status_results)
     
     print(f"📊 Signal Distribution:")
@@ -334,13 +361,10 @@ def run_comprehensive_us30_analysis():
     print(f"\n💡 Key Highlights:")
     print(f"   📅 Analysis Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}")
     print(f"   💰 Current Price: ${latest_row['close']:,.2f}")
-    print(f"   📊 24h Change: ${total_change:+,.2f} ({total_change/last_7_closes.iloc[0]*100:+.2f}%)")
+    print(f"   📊 24h Change: ${total_change:+,.2f} ({total_change/start_price*100:+.2f}%)")
     print(f"   📈 Data Points: {len(data)} (30-min intervals over 7 days)")
     
     # Top signals
-    buy_indicators = [name for name, data in status_results.items() if data['status'] == 'Buy']
-    sell_indicators = [name for name, data in status_results.items() if data['status'] == 'Sell']
-    
     if buy_indicators:
         print(f"   🟢 Strong Buy Signals: {', '.join(buy_indicators[:3])}{'...' if len(buy_indicators) > 3 else ''}")
     
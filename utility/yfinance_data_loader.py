@@ -1,6 +1,136 @@
-import yfinance as yf
+import logging
+import os
+import re
+import time
+from urllib.parse import quote
+
 import pandas as pd
 
+logger = logging.getLogger(__name__)
+
+# Downloads are kept on disk until the bar they were fetched in has closed
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "tradingalertcli", "yfinance")
+
+_INTERVAL_RE = re.compile(r'^(\d+)(mo|wk|m|h|d)$')
+_INTERVAL_UNIT_SECONDS = {'m': 60, 'h': 3600, 'd': 86400, 'wk': 604800, 'mo': 2592000}
+
+def _interval_seconds(interval):
+    """Length of one yfinance interval such as '30m' or '1h' in seconds, or None."""
+    match = _INTERVAL_RE.match(interval)
+    if not match:
+        return None
+    return int(match.group(1)) * _INTERVAL_UNIT_SECONDS[match.group(2)]
+
+# yf.download column names and the lowercase names the analysis code uses
+COLUMN_MAP = {
+    'Open': 'open',
+    'High': 'high',
+    'Low': 'low',
+    'Close': 'close',
+    'Volume': 'volume',
+    'Adj Close': 'adj_close'
+}
+
+def flatten_columns(columns, symbol):
+    """
+    Column names of a yf.download result without the ticker, e.g. 'Close'.
+    
+    MultiIndex (field, ticker) columns are joined and the '_<symbol>' suffix is
+    stripped in a single pass over the index.
+    """
+    suffix_re = re.compile(rf'_{re.escape(symbol)}$')
+    if isinstance(columns, pd.MultiIndex):
+        return columns.to_flat_index().map(lambda col: suffix_re.sub('', '_'.join(part for part in col if part)))
+    return columns.map(lambda col: suffix_re.sub('', col))
+
+def _yf_download(symbols, **kwargs):
+    """Call yf.download, importing yfinance (slow to import) only when a fetch happens."""
+    import yfinance as yf
+    return yf.download(symbols, **kwargs)
+
+def download_cached(symbols, period='7d', interval='1h', **kwargs):
+    """
+    Download data with yf.download, reusing the copy saved during the current bar.
+    
+    Repeated runs within one bar of the requested interval are served from
+    CACHE_DIR instead of going back to Yahoo.
+    
+    Args:
+        symbols: Ticker, or space-separated tickers, passed to yf.download
+        period: Data period (default '7d')
+        interval: Data interval (default '1h')
+        **kwargs: Further yf.download arguments
+        
+    Returns:
+        pandas.DataFrame: Data as returned by yf.download
+    """
+    bar_seconds = _interval_seconds(interval)
+    if bar_seconds is None:
+        return _yf_download(symbols, period=period, interval=interval, **kwargs)
+    
+    # Everything except the progress bar changes what yf.download returns
+    key_parts = [symbols, period, interval]
+    key_parts += [f"{k}={v}" for k, v in sorted(kwargs.items()) if k != 'progress']
+    key = quote('_'.join(key_parts), safe='')
+    bucket = int(time.time() // bar_seconds)
+    path = os.path.join(CACHE_DIR, f"{key}.{bucket}.pkl")
+    
+    if os.path.exists(path):
+        try:
+            return pd.read_pickle(path)
+        except Exception:
+            logger.debug("Ignoring unreadable cache file %s", path, exc_info=True)
+    
+    data = _yf_download(symbols, period=period, interval=interval, **kwargs)
+    if data.empty:
+        return data
+    
+    try:
+        # Private to the user, since cached files are unpickled on read
+        os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+        # Drop copies from earlier bars, then write through a temp file
+        for name in os.listdir(CACHE_DIR):
+            if name.startswith(key + '.') and name.endswith('.pkl'):
+                os.remove(os.path.join(CACHE_DIR, name))
+        tmp_path = path + '.tmp'
+        data.to_pickle(tmp_path)
+        os.replace(tmp_path, path)
+    except OSError:
+        logger.debug("Could not write cache file %s", path, exc_info=True)
+    
+    return data
+
+def fetch_symbols(symbols, period='7d', interval='1h'):
+    """
+    Fetch several symbols with a single yf.download call.
+    
+    Args:
+        symbols: List of tickers
+        period: Data period (default '7d')
+        interval: Data interval (default '1h')
+        
+    Returns:
+        dict: Symbol -> DataFrame with yfinance's 'Open', 'High', ... columns;
+        symbols Yahoo returned nothing for map to an empty DataFrame
+    """
+    data = download_cached(' '.join(symbols), period=period, interval=interval,
+                           group_by='ticker', threads=True, progress=False)
+    
+    results = {}
+    for symbol in symbols:
+        if data.empty:
+            results[symbol] = pd.DataFrame()
+        elif isinstance(data.columns, pd.MultiIndex):
+            # group_by='ticker' puts the symbol on the first column level
+            if symbol in data.columns.get_level_values(0):
+                results[symbol] = data[symbol]
+            else:
+                results[symbol] = pd.DataFrame()
+        else:
+            results[symbol] = data
+    
+    return results
+
 def fetch_eurusd_data(period='7d', interval='1h'):
     """
     Fetch EURUSD data from yfinance.
@@ -14,16 +144,10 @@ def fetch_eurusd_data(period='7d', interval='1h'):
     """
     target_symbol = 'EURUSD=X'
     
-    eurusd_data = yf.download(target_symbol, period=period, interval=interval)
+    eurusd_data = fetch_symbols([target_symbol], period=period, interval=interval)[target_symbol]
     
-    # Flatten the MultiIndex columns if they exist
-    if isinstance(eurusd_data.columns, pd.MultiIndex):
-        eurusd_data.columns = ['_'.join(col).strip() for col in eurusd_data.columns.values]
-        # Remove trailing underscores if they exist (from the empty string in the tuple)
-        eurusd_data.columns = [col[:-1] if col.endswith('_') else col for col in eurusd_data.columns]
-
-    # Remove the '_EURUSD=X' suffix from column names
-    eurusd_data.columns = [col.replace(f'_{target_symbol}', '') for col in eurusd_data.columns]
+    # Flatten the MultiIndex columns and remove the '_EURUSD=X' suffix
+    eurusd_data.columns = flatten_columns(eurusd_data.columns, target_symbol)
 
     eurusd_data.rename(columns={'Open': 'open', 'High': 'high', 'Low': 'low', 'Close': 'close', 'Volume': 'volume'}, inplace=True)
 
@@ -11,12 +11,48 @@ This script focuses on analyzing forex and indices groups with:
 
 import sys
 import os
+import argparse
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utility.symbol_groups_manager import SymbolGroupManager, SymbolGroup, SymbolConfig
 from workflow.group_analysis_engine import GroupAnalysisEngine, GroupAnalysisReporter
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+SEP = "=" * 80
+
+# (symbol key, symbol, timeframe, period) for each focused group
+FOREX_SPECS = [
+    ("eurusd_15m", "eurusd", "15m", "5d"),
+    ("gbpusd_15m", "gbpusd", "15m", "5d"),
+    ("usdjpy_30m", "usdjpy", "30m", "1mo"),
+    ("audusd_1h", "audusd", "1h", "1mo"),
+]
+INDICES_SPECS = [
+    ("dow30", "dow30", "30m", "5d"),
+    ("sp500", "sp500", "30m", "5d"),
+    ("nasdaq", "nasdaq", "1h", "1mo"),
+]
+
+_TRENDS = np.array([" ↘️ Falling", " ➡️ Stable", " ↗️ Rising", ""])
+_SENTIMENT_EMOJI = {"BULLISH": "🟢", "BEARISH": "🔴", "NEUTRAL": "🟡"}
+_SIGNAL_EMOJI = {"Buy": "🟢", "Sell": "🔴"}
+# Indexed by (bullish > bearish) - (bearish > bullish)
+_SENTIMENTS = ("NEUTRAL", "BULLISH", "BEARISH")
+
+def _net_sentiment(bullish, bearish):
+    """BULLISH, BEARISH or NEUTRAL depending on which side has more votes."""
+    return _SENTIMENTS[(bullish > bearish) - (bearish > bullish)]
+
+def _compute_rr(price, stop_loss, take_profit, long=True):
+    """(risk, reward, reward/risk) of a trade entered at price; the ratio is 0 without risk."""
+    if long:
+        risk, reward = price - stop_loss, take_profit - price
+    else:
+        risk, reward = stop_loss - price, price - take_profit
+    return risk, reward, reward / risk if risk > 0 else 0
+
 def create_focused_groups(manager: SymbolGroupManager):
     """Create focused groups for forex and indices analysis."""
     
@@ -30,36 +66,9 @@ def create_focused_groups(manager: SymbolGroupManager):
         group_id="forex_analysis",
         name="Forex Analysis Group",
         description="Major forex pairs for detailed technical analysis",
-        symbols={
-            "eurusd_15m": SymbolConfig(
-                symbol="eurusd",
-                asset_type="forex",
-                timeframe="15m",
-                period="5d",
-                enabled=True
-            ),
-            "gbpusd_15m": SymbolConfig(
-                symbol="gbpusd",
-                asset_type="forex",
-                timeframe="15m",
-                period="5d",
-                enabled=True
-            ),
-            "usdjpy_30m": SymbolConfig(
-                symbol="usdjpy",
-                asset_type="forex",
-                timeframe="30m",
-                period="1mo",
-                enabled=True
-            ),
-            "audusd_1h": SymbolConfig(
-                symbol="audusd",
-                asset_type="forex",
-                timeframe="1h",
-                period="1mo",
-                enabled=True
-            )
-        },
+        symbols={key: SymbolConfig(symbol=symbol, asset_type="forex", timeframe=timeframe,
+                                   period=period, enabled=True)
+                 for key, symbol, timeframe, period in FOREX_SPECS},
         created_at=now,
         updated_at=now,
         enabled=True,
@@ -71,29 +80,9 @@ def create_focused_groups(manager: SymbolGroupManager):
         group_id="indices_analysis",
         name="Indices Analysis Group", 
         description="Major stock indices for trend and momentum analysis",
-        symbols={
-            "dow30": SymbolConfig(
-                symbol="dow30",
-                asset_type="indices",
-                timeframe="30m",
-                period="5d",
-                enabled=True
-            ),
-            "sp500": SymbolConfig(
-                symbol="sp500",
-                asset_type="indices",
-                timeframe="30m", 
-                period="5d",
-                enabled=True
-            ),
-            "nasdaq": SymbolConfig(
-                symbol="nasdaq",
-                asset_type="indices",
-                timeframe="1h",
-                period="1mo",
-                enabled=True
-            )
-        },
+        symbols={key: SymbolConfig(symbol=symbol, asset_type="indices", timeframe=timeframe,
+                                   period=period, enabled=True)
+                 for key, symbol, timeframe, period in INDICES_SPECS},
         created_at=now,
         updated_at=now,
         enabled=True,
@@ -102,9 +91,12 @@ def create_focused_groups(manager: SymbolGroupManager):
     
     # Save groups
     groups = [forex_group, indices_group]
-    for group in groups:
-        success = manager.save_group(group)
-        status = "✅" if success else "❌"
+    with manager.batch_updates():
+        queued = [manager.save_group(group) for group in groups]
+    # Saves in a batch only queue the change; flush() reports whether it reached disk
+    written = manager.flush()
+    for group, success in zip(groups, queued):
+        status = "✅" if success and written else "❌"
         print(f"   {status} {group.name} ({group.group_id})")
     
     print(f"✅ Created {len(groups)} focused analysis groups")
@@ -113,210 +105,196 @@ def create_focused_groups(manager: SymbolGroupManager):
 def detailed_individual_analysis(result, symbol_result):
     """Show detailed individual element analysis."""
     
-    print(f"\n{'='*80}")
-    print(f"🔍 DETAILED INDIVIDUAL ANALYSIS: {symbol_result.symbol_key}")
-    print(f"{'='*80}")
+    out = []
+    out.append(f"\n{SEP}")
+    out.append(f"🔍 DETAILED INDIVIDUAL ANALYSIS: {symbol_result.symbol_key}")
+    out.append(SEP)
     
     # Basic Information
-    print(f"📋 Basic Information:")
-    print(f"   Symbol: {symbol_result.symbol} ({symbol_result.asset_type.upper()})")
-    print(f"   Timeframe: {symbol_result.timeframe}")
-    print(f"   Period: {symbol_result.period}")
-    print(f"   Data Points: {symbol_result.data_points}")
-    print(f"   Analysis Time: {symbol_result.analysis_timestamp}")
+    out.append(f"📋 Basic Information:")
+    out.append(f"   Symbol: {symbol_result.symbol} ({symbol_result.asset_type.upper()})")
+    out.append(f"   Timeframe: {symbol_result.timeframe}")
+    out.append(f"   Period: {symbol_result.period}")
+    out.append(f"   Data Points: {symbol_result.data_points}")
+    out.append(f"   Analysis Time: {symbol_result.analysis_timestamp}")
     
     # Price Analysis
-    print(f"\n💰 Price Analysis:")
-    print(f"   Current Price: ${symbol_result.latest_price:.4f}")
-    print(f"   Price Change: {symbol_result.price_change:+.4f} ({symbol_result.price_change_pct:+.2f}%)")
+    out.append(f"\n💰 Price Analysis:")
+    out.append(f"   Current Price: ${symbol_result.latest_price:.4f}")
+    out.append(f"   Price Change: {symbol_result.price_change:+.4f} ({symbol_result.price_change_pct:+.2f}%)")
     
     # Last 7 Prices
     if symbol_result.last_7_prices:
-        print(f"\n📈 Last 7 Prices History:")
-        for i, price in enumerate(reversed(symbol_result.last_7_prices), 1):
-            change_from_current = price - symbol_result.latest_price
-            change_pct = (change_from_current / symbol_result.latest_price) * 100
-            print(f"   -{i}: ${price:.4f} ({change_from_current:+.4f}, {change_pct:+.1f}%)")
+        out.append(f"\n📈 Last 7 Prices History:")
+        prices = np.asarray(symbol_result.last_7_prices, dtype=np.float64)[::-1]
+        changes = prices - symbol_result.latest_price
+        change_pcts = changes / symbol_result.latest_price * 100
+        for i, (price, change_from_current, change_pct) in enumerate(zip(prices, changes, change_pcts), 1):
+            out.append(f"   -{i}: ${price:.4f} ({change_from_current:+.4f}, {change_pct:+.1f}%)")
     
     # Technical Indicators
     if symbol_result.indicators:
-        print(f"\n📊 Technical Indicators:")
+        out.append(f"\n📊 Technical Indicators:")
         for indicator, value in symbol_result.indicators.items():
-            print(f"   {indicator}: {value:.4f}")
+            out.append(f"   {indicator}: {value:.4f}")
     
     # Oscillator Status Details
     if symbol_result.oscillator_status:
-        print(f"\n🎯 Oscillator Status (Individual Elements):")
-        buy_signals = 0
-        sell_signals = 0
-        neutral_signals = 0
+        out.append(f"\n🎯 Oscillator Status (Individual Elements):")
+        names = list(symbol_result.oscillator_status)
+        status_data = list(symbol_result.oscillator_status.values())
+        statuses = np.array([d.get('status', 'Unknown') for d in status_data])
+        values = np.array([d.get('value', 0) for d in status_data], dtype=np.float64)
+        prev_values = [d.get('previous_value') for d in status_data]
+        has_prev = np.array([v is not None for v in prev_values])
+        prev = np.array([np.nan if v is None else v for v in prev_values], dtype=np.float64)
         
-        for oscillator, status_data in symbol_result.oscillator_status.items():
-            status = status_data.get('status', 'Unknown')
-            value = status_data.get('value', 0)
-            prev_value = status_data.get('previous_value')
-            
-            # Count signals
-            if status == 'Buy':
-                buy_signals += 1
-                signal_emoji = "🟢"
-            elif status == 'Sell':
-                sell_signals += 1
-                signal_emoji = "🔴"
-            else:
-                neutral_signals += 1
-                signal_emoji = "🟡"
-            
-            # Trend analysis
-            trend = ""
-            if prev_value is not None:
-                if value > prev_value:
-                    trend = " ↗️ Rising"
-                elif value < prev_value:
-                    trend = " ↘️ Falling"
-                else:
-                    trend = " ➡️ Stable"
-            
-            print(f"   {signal_emoji} {oscillator}:")
-            print(f"      Status: {status}")
-            print(f"      Value: {value:.4f}{trend}")
+        # Count signals
+        is_buy = statuses == 'Buy'
+        is_sell = statuses == 'Sell'
+        buy_signals = int(np.count_nonzero(is_buy))
+        sell_signals = int(np.count_nonzero(is_sell))
+        neutral_signals = len(statuses) - buy_signals - sell_signals
+        signal_emojis = np.where(is_buy, _SIGNAL_EMOJI['Buy'], np.where(is_sell, _SIGNAL_EMOJI['Sell'], "🟡"))
+        
+        # Trend analysis: -1/0/+1 against the previous value, blank without one
+        direction = (values > prev).astype(int) - (values < prev).astype(int)
+        trends = _TRENDS[np.where(has_prev, direction + 1, 3)]
+        
+        for oscillator, signal_emoji, status, value, trend, prev_value in zip(
+                names, signal_emojis, statuses, values, trends, prev_values):
+            out.append(f"   {signal_emoji} {oscillator}:")
+            out.append(f"      Status: {status}")
+            out.append(f"      Value: {value:.4f}{trend}")
             if prev_value is not None:
-                print(f"      Previous: {prev_value:.4f}")
+                out.append(f"      Previous: {prev_value:.4f}")
         
         # Cumulative Status Summary
         total_signals = buy_signals + sell_signals + neutral_signals
-        print(f"\n📊 Cumulative Oscillator Status:")
-        print(f"   🟢 Buy Signals: {buy_signals}/{total_signals} ({buy_signals/total_signals*100:.1f}%)")
-        print(f"   🔴 Sell Signals: {sell_signals}/{total_signals} ({sell_signals/total_signals*100:.1f}%)")
-        print(f"   🟡 Neutral Signals: {neutral_signals}/{total_signals} ({neutral_signals/total_signals*100:.1f}%)")
+        out.append(f"\n📊 Cumulative Oscillator Status:")
+        out.append(f"   🟢 Buy Signals: {buy_signals}/{total_signals} ({buy_signals/total_signals*100:.1f}%)")
+        out.append(f"   🔴 Sell Signals: {sell_signals}/{total_signals} ({sell_signals/total_signals*100:.1f}%)")
+        out.append(f"   🟡 Neutral Signals: {neutral_signals}/{total_signals} ({neutral_signals/total_signals*100:.1f}%)")
         
         # Overall sentiment determination
-        if buy_signals > sell_signals:
-            overall_sentiment = "BULLISH"
-            sentiment_emoji = "🟢"
-        elif sell_signals > buy_signals:
-            overall_sentiment = "BEARISH" 
-            sentiment_emoji = "🔴"
-        else:
-            overall_sentiment = "NEUTRAL"
-            sentiment_emoji = "🟡"
-        
-        print(f"   {sentiment_emoji} Overall Sentiment: {overall_sentiment}")
+        overall_sentiment = _net_sentiment(buy_signals, sell_signals)
+        out.append(f"   {_SENTIMENT_EMOJI[overall_sentiment]} Overall Sentiment: {overall_sentiment}")
     
     # ATR Trading Levels
     if symbol_result.atr_bands:
-        print(f"\n🎯 ATR Trading Levels:")
-        atr_value = symbol_result.atr_bands.get('atr_value', 0)
-        print(f"   ATR(14): {atr_value:.4f}")
+        bands = symbol_result.atr_bands
+        price = symbol_result.latest_price
+        out.append(f"\n🎯 ATR Trading Levels:")
+        atr_value = bands.get('atr_value', 0)
+        out.append(f"   ATR(14): {atr_value:.4f}")
         
-        print(f"\n   📊 ATR Bands:")
-        print(f"   Upper Band (2.0x): ${symbol_result.atr_bands.get('upper_band_2x', 0):.4f}")
-        print(f"   Upper Band (1.5x): ${symbol_result.atr_bands.get('upper_band_1.5x', 0):.4f}")
-        print(f"   Current Price:     ${symbol_result.latest_price:.4f}")
-        print(f"   Lower Band (1.5x): ${symbol_result.atr_bands.get('lower_band_1.5x', 0):.4f}")
-        print(f"   Lower Band (2.0x): ${symbol_result.atr_bands.get('lower_band_2x', 0):.4f}")
+        out.append(f"\n   📊 ATR Bands:")
+        upper2 = bands.get('upper_band_2x', 0)
+        upper15 = bands.get('upper_band_1.5x', 0)
+        lower15 = bands.get('lower_band_1.5x', 0)
+        lower2 = bands.get('lower_band_2x', 0)
+        out.append(f"   Upper Band (2.0x): ${upper2:.4f}")
+        out.append(f"   Upper Band (1.5x): ${upper15:.4f}")
+        out.append(f"   Current Price:     ${price:.4f}")
+        out.append(f"   Lower Band (1.5x): ${lower15:.4f}")
+        out.append(f"   Lower Band (2.0x): ${lower2:.4f}")
         
         # Trading recommendations based on sentiment
-        if symbol_result.overall_sentiment == "BULLISH":
-            stop_loss = symbol_result.atr_bands.get('stop_loss_long', 0)
-            take_profit = symbol_result.atr_bands.get('take_profit_long', 0)
-            risk = symbol_result.latest_price - stop_loss
-            reward = take_profit - symbol_result.latest_price
-            risk_reward = reward / risk if risk > 0 else 0
+        if symbol_result.overall_sentiment in ("BULLISH", "BEARISH"):
+            long = symbol_result.overall_sentiment == "BULLISH"
+            side = "long" if long else "short"
+            stop_loss = bands.get(f'stop_loss_{side}', 0)
+            take_profit = bands.get(f'take_profit_{side}', 0)
+            risk, reward, risk_reward = _compute_rr(price, stop_loss, take_profit, long)
             
-            print(f"\n   🟢 LONG Trading Setup:")
-            print(f"   Entry: ${symbol_result.latest_price:.4f}")
-            print(f"   Stop Loss: ${stop_loss:.4f} (Risk: ${risk:.4f})")
-            print(f"   Take Profit: ${take_profit:.4f} (Reward: ${reward:.4f})")
-            print(f"   Risk/Reward Ratio: 1:{risk_reward:.1f}")
-            
-        elif symbol_result.overall_sentiment == "BEARISH":
-            stop_loss = symbol_result.atr_bands.get('stop_loss_short', 0)
-            take_profit = symbol_result.atr_bands.get('take_profit_short', 0)
-            risk = stop_loss - symbol_result.latest_price
-            reward = symbol_result.latest_price - take_profit
-            risk_reward = reward / risk if risk > 0 else 0
-            
-            print(f"\n   🔴 SHORT Trading Setup:")
-            print(f"   Entry: ${symbol_result.latest_price:.4f}")
-            print(f"   Stop Loss: ${stop_loss:.4f} (Risk: ${risk:.4f})")
-            print(f"   Take Profit: ${take_profit:.4f} (Reward: ${reward:.4f})")
-            print(f"   Risk/Reward Ratio: 1:{risk_reward:.1f}")
+            out.append(f"\n   {'🟢 LONG' if long else '🔴 SHORT'} Trading Setup:")
+            out.append(f"   Entry: ${price:.4f}")
+            out.append(f"   Stop Loss: ${stop_loss:.4f} (Risk: ${risk:.4f})")
+            out.append(f"   Take Profit: ${take_profit:.4f} (Reward: ${reward:.4f})")
+            out.append(f"   Risk/Reward Ratio: 1:{risk_reward:.1f}")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 def enhanced_group_sentiment_analysis(result):
     """Show enhanced group sentiment with individual element breakdown."""
     
-    print(f"\n{'='*80}")
-    print(f"🎯 ENHANCED GROUP SENTIMENT ANALYSIS: {result.group_name}")
-    print(f"{'='*80}")
+    out = []
+    out.append(f"\n{SEP}")
+    out.append(f"🎯 ENHANCED GROUP SENTIMENT ANALYSIS: {result.group_name}")
+    out.append(SEP)
     
     # Group overview
-    print(f"📊 Group Overview:")
-    print(f"   Total Symbols: {result.total_symbols}")
-    print(f"   Successful Analyses: {result.successful_analyses}")
-    print(f"   Failed Analyses: {result.failed_analyses}")
-    print(f"   Success Rate: {result.successful_analyses/result.total_symbols*100:.1f}%")
+    out.append(f"📊 Group Overview:")
+    out.append(f"   Total Symbols: {result.total_symbols}")
+    out.append(f"   Successful Analyses: {result.successful_analyses}")
+    out.append(f"   Failed Analyses: {result.failed_analyses}")
+    success_rate = (result.successful_analyses / result.total_symbols * 100) if result.total_symbols > 0 else 0
+    out.append(f"   Success Rate: {success_rate:.1f}%")
+    
+    if result.successful_analyses == 0:
+        out.append(f"\n⚠️  No successful analyses to report")
+        sys.stdout.write("\n".join(out) + "\n")
+        return
     
     # Individual element sentiments
-    print(f"\n🔍 Individual Element Sentiments:")
-    bullish_count = 0
-    bearish_count = 0
-    neutral_count = 0
+    out.append(f"\n🔍 Individual Element Sentiments:")
+    sentiment_counts = dict.fromkeys(_SENTIMENT_EMOJI, 0)
+    total_buy = 0
+    total_sell = 0
+    total_neutral = 0
     
     for symbol_key, symbol_result in result.symbol_results.items():
         if symbol_result.success:
             sentiment = symbol_result.overall_sentiment
-            if sentiment == "BULLISH":
-                bullish_count += 1
-                emoji = "🟢"
-            elif sentiment == "BEARISH":
-                bearish_count += 1
-                emoji = "🔴"
-            else:
-                neutral_count += 1
-                emoji = "🟡"
+            counted_as = sentiment if sentiment in sentiment_counts else "NEUTRAL"
+            sentiment_counts[counted_as] += 1
+            emoji = _SENTIMENT_EMOJI[counted_as]
+            
+            signals = symbol_result.signals_summary
+            buy, sell, neutral = signals['Buy'], signals['Sell'], signals['Neutral']
+            out.append(f"   {emoji} {symbol_key:<15}: {sentiment:<8} (Buy:{buy}, Sell:{sell}, Neutral:{neutral})")
             
-            print(f"   {emoji} {symbol_key:<15}: {sentiment:<8} (Buy:{symbol_result.signals_summary['Buy']}, "
-                  f"Sell:{symbol_result.signals_summary['Sell']}, Neutral:{symbol_result.signals_summary['Neutral']})")
+            # Group signals aggregation
+            total_buy += buy
+            total_sell += sell
+            total_neutral += neutral
     
     # Group sentiment summary
+    bullish_count = sentiment_counts["BULLISH"]
+    bearish_count = sentiment_counts["BEARISH"]
+    neutral_count = sentiment_counts["NEUTRAL"]
     total_successful = bullish_count + bearish_count + neutral_count
     if total_successful > 0:
-        print(f"\n📈 Group Sentiment Breakdown:")
-        print(f"   🟢 Bullish Elements: {bullish_count}/{total_successful} ({bullish_count/total_successful*100:.1f}%)")
-        print(f"   🔴 Bearish Elements: {bearish_count}/{total_successful} ({bearish_count/total_successful*100:.1f}%)")
-        print(f"   🟡 Neutral Elements: {neutral_count}/{total_successful} ({neutral_count/total_successful*100:.1f}%)")
+        out.append(f"\n📈 Group Sentiment Breakdown:")
+        out.append(f"   🟢 Bullish Elements: {bullish_count}/{total_successful} ({bullish_count/total_successful*100:.1f}%)")
+        out.append(f"   🔴 Bearish Elements: {bearish_count}/{total_successful} ({bearish_count/total_successful*100:.1f}%)")
+        out.append(f"   🟡 Neutral Elements: {neutral_count}/{total_successful} ({neutral_count/total_successful*100:.1f}%)")
         
         # Overall group sentiment
-        if bullish_count > bearish_count:
-            group_sentiment = "BULLISH"
-            sentiment_emoji = "🟢"
-        elif bearish_count > bullish_count:
-            group_sentiment = "BEARISH"
-            sentiment_emoji = "🔴"
-        else:
-            group_sentiment = "NEUTRAL"
-            sentiment_emoji = "🟡"
-        
-        print(f"\n   {sentiment_emoji} Overall Group Sentiment: {group_sentiment}")
+        group_sentiment = _net_sentiment(bullish_count, bearish_count)
+        out.append(f"\n   {_SENTIMENT_EMOJI[group_sentiment]} Overall Group Sentiment: {group_sentiment}")
         
-        # Group signals aggregation
-        total_buy = sum(r.signals_summary['Buy'] for r in result.symbol_results.values() if r.success)
-        total_sell = sum(r.signals_summary['Sell'] for r in result.symbol_results.values() if r.success)
-        total_neutral = sum(r.signals_summary['Neutral'] for r in result.symbol_results.values() if r.success)
         total_signals = total_buy + total_sell + total_neutral
         
         if total_signals > 0:
-            print(f"\n📊 Cumulative Group Signals:")
-            print(f"   🟢 Total Buy Signals: {total_buy}/{total_signals} ({total_buy/total_signals*100:.1f}%)")
-            print(f"   🔴 Total Sell Signals: {total_sell}/{total_signals} ({total_sell/total_signals*100:.1f}%)")
-            print(f"   🟡 Total Neutral Signals: {total_neutral}/{total_signals} ({total_neutral/total_signals*100:.1f}%)")
+            out.append(f"\n📊 Cumulative Group Signals:")
+            out.append(f"   🟢 Total Buy Signals: {total_buy}/{total_signals} ({total_buy/total_signals*100:.1f}%)")
+            out.append(f"   🔴 Total Sell Signals: {total_sell}/{total_signals} ({total_sell/total_signals*100:.1f}%)")
+            out.append(f"   🟡 Total Neutral Signals: {total_neutral}/{total_signals} ({total_neutral/total_signals*100:.1f}%)")
 
-def main():
-    """Main enhanced analysis function."""
+    sys.stdout.write("\n".join(out) + "\n")
+
+def main(detailed: bool = True):
+    """
+    Main enhanced analysis function.
+    
+    Args:
+        detailed: Print the per-symbol breakdowns; with False only the group
+            summaries are formatted and printed
+    """
     
     print("🚀 Enhanced Forex and Indices Analysis")
-    print("="*80)
+    print(SEP)
     
     # Initialize components
     manager = SymbolGroupManager()
@@ -326,53 +304,64 @@ def main():
         # Step 1: Create focused groups
         demo_groups = create_focused_groups(manager)
         
-        # Step 2: Analyze forex group with detailed breakdown
-        print(f"\n{'='*80}")
+        # Use the groups just created rather than looking them up again
+        groups_by_id = {group.group_id: group for group in demo_groups}
+        forex_group = groups_by_id.get("forex_analysis")
+        indices_group = groups_by_id.get("indices_analysis")
+        
+        # Step 2: Analyze both groups at once so their downloads overlap
+        groups = [group for group in (forex_group, indices_group) if group]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = dict(zip([group.group_id for group in groups],
+                               executor.map(engine.analyze_group, groups)))
+        
+        # Step 3: Forex group detailed breakdown
+        print(f"\n{SEP}")
         print("🔍 FOREX GROUP ANALYSIS")
-        print("="*80)
+        print(SEP)
         
-        forex_group = manager.get_group("forex_analysis")
         if forex_group:
-            result = engine.analyze_group(forex_group)
-            GroupAnalysisReporter.print_group_result(result, detailed=True)
+            result = results[forex_group.group_id]
+            GroupAnalysisReporter.print_group_result(result, detailed=detailed)
             
             # Enhanced group sentiment analysis
             enhanced_group_sentiment_analysis(result)
             
             # Show detailed analysis for each successful symbol
-            print(f"\n{'='*80}")
-            print("📊 INDIVIDUAL FOREX ELEMENTS DETAILED ANALYSIS")
-            print("="*80)
-            
-            for symbol_key, symbol_result in result.symbol_results.items():
-                if symbol_result.success:
-                    detailed_individual_analysis(result, symbol_result)
+            if detailed:
+                print(f"\n{SEP}")
+                print("📊 INDIVIDUAL FOREX ELEMENTS DETAILED ANALYSIS")
+                print(SEP)
+                
+                for symbol_key, symbol_result in result.symbol_results.items():
+                    if symbol_result.success:
+                        detailed_individual_analysis(result, symbol_result)
         
-        # Step 3: Analyze indices group with detailed breakdown
-        print(f"\n{'='*80}")
+        # Step 4: Indices group detailed breakdown
+        print(f"\n{SEP}")
         print("🔍 INDICES GROUP ANALYSIS")
-        print("="*80)
+        print(SEP)
         
-        indices_group = manager.get_group("indices_analysis")
         if indices_group:
-            result = engine.analyze_group(indices_group)
-            GroupAnalysisReporter.print_group_result(result, detailed=True)
+            result = results[indices_group.group_id]
+            GroupAnalysisReporter.print_group_result(result, detailed=detailed)
             
             # Enhanced group sentiment analysis
             enhanced_group_sentiment_analysis(result)
             
             # Show detailed analysis for each successful symbol
-            print(f"\n{'='*80}")
-            print("📊 INDIVIDUAL INDICES ELEMENTS DETAILED ANALYSIS")
-            print("="*80)
-            
-            for symbol_key, symbol_result in result.symbol_results.items():
-                if symbol_result.success:
-                    detailed_individual_analysis(result, symbol_result)
+            if detailed:
+                print(f"\n{SEP}")
+                print("📊 INDIVIDUAL INDICES ELEMENTS DETAILED ANALYSIS")
+                print(SEP)
+                
+                for symbol_key, symbol_result in result.symbol_results.items():
+                    if symbol_result.success:
+                        detailed_individual_analysis(result, symbol_result)
         
-        print(f"\n{'='*80}")
+        print(f"\n{SEP}")
         print("✅ ENHANCED ANALYSIS COMPLETED")
-        print("="*80)
+        print(SEP)
         
     except Exception as e:
         print(f"❌ Analysis failed with error: {str(e)}")
@@ -380,4 +369,8 @@ def main():
         traceback.print_exc()
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Enhanced forex and indices analysis")
+    parser.add_argument("--quiet", action="store_true",
+                        help="only print the group summaries, skipping the per-symbol detail")
+    args = parser.parse_args()
+    main(detailed=not args.quiet)